@@ -5,278 +5,192 @@ Database helpers and schema initialization for both SQLite and PostgreSQL.
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Iterable, Tuple, Union
+from functools import lru_cache
+from importlib import resources
+from typing import Any, Callable, ContextManager, Dict, Generator, List, Optional, Set, Tuple, Union
+import atexit
+import re
 import sqlite3
+import threading
 
 from .config import settings
 
-# Import psycopg2 if available (for PostgreSQL)
-try:
-    import psycopg2
-    import psycopg2.extras
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    PSYCOPG2_AVAILABLE = False
-
 
-def dict_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Dict[str, Any]:
+def fetch_all_dicts(cursor: Any) -> List[Dict[str, Any]]:
     """
-    Convert sqlite rows into dictionaries keyed by column name.
+    Fetch every remaining row as a dict keyed by column name. SQLite rows come
+    back as plain tuples, so the column names are read once per result set
+    rather than once per row. PostgreSQL rows are already dicts.
     """
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
-
-
-@contextmanager
-def get_connection() -> Generator[Union[sqlite3.Connection, Any], None, None]:
+    rows = cursor.fetchall()
+    if not rows or isinstance(rows[0], dict):
+        return rows
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+def fetch_one_dict(cursor: Any) -> Optional[Dict[str, Any]]:
+    """Fetch the next row as a dict keyed by column name (or None)."""
+    row = cursor.fetchone()
+    if row is None or isinstance(row, dict):
+        return row
+    return dict(zip([col[0] for col in cursor.description], row, strict=True))
+
+
+# Connections are opened once and reused: a pooled psycopg2 connection for
+# PostgreSQL, and one long-lived SQLite handle per thread.
+_pg_pool: Any = None
+_pg_pool_lock = threading.Lock()
+_sqlite_local = threading.local()
+# Every open SQLite handle, so close_connections() can reach other threads'.
+# Bumping the generation invalidates the thread-local handles after a close.
+_sqlite_connections: List[sqlite3.Connection] = []
+_sqlite_lock = threading.Lock()
+_sqlite_generation = 0
+
+
+def _get_pg_pool() -> Any:
+    global _pg_pool
+    if _pg_pool is None:
+        with _pg_pool_lock:
+            if _pg_pool is None:
+                # psycopg2 is imported here rather than at module load so
+                # SQLite-only deployments never pay for the C extension.
+                import psycopg2.extras
+                import psycopg2.pool
+
+                _pg_pool = psycopg2.pool.ThreadedConnectionPool(
+                    1,
+                    16,
+                    settings.database_url,
+                    cursor_factory=psycopg2.extras.RealDictCursor,
+                )
+    return _pg_pool
+
+
+def _get_sqlite_connection() -> sqlite3.Connection:
     """
-    Context manager that yields a database connection and guarantees it is closed.
-    Returns either SQLite or PostgreSQL connection based on settings.database_type.
+    Return this thread's SQLite connection, opening it (and applying the
+    per-connection PRAGMAs) on first use.
     """
-    if settings.database_type == "postgresql":
-        if not PSYCOPG2_AVAILABLE:
-            raise RuntimeError("psycopg2 is required for PostgreSQL but not installed")
-
-        conn = psycopg2.connect(
-            settings.database_url,
-            cursor_factory=psycopg2.extras.RealDictCursor
-        )
-        try:
-            yield conn
-        finally:
-            conn.close()
-    else:
-        # SQLite mode
-        conn = sqlite3.connect(settings.database_path, timeout=5.0)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA busy_timeout = 5000;")
-        conn.execute("PRAGMA foreign_keys = ON;")
-        try:
-            yield conn
-        finally:
-            conn.close()
-
-
-def _get_schema_statements() -> Iterable[str]:
+    conn = getattr(_sqlite_local, "conn", None)
+    if conn is not None and getattr(_sqlite_local, "generation", None) == _sqlite_generation:
+        if _sqlite_local.path == settings.database_path:
+            return conn
+        with _sqlite_lock:
+            _sqlite_connections.remove(conn)
+        conn.close()
+    # The default statement cache (128) is shared by every distinct query the
+    # app issues; a larger one keeps the hot INSERT/UPDATE statements prepared.
+    conn = sqlite3.connect(
+        settings.database_path,
+        timeout=5.0,
+        check_same_thread=False,
+        cached_statements=256,
+    )
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA foreign_keys = ON;")
+    # Per-connection tuning for the append-heavy EventLog/TemperatureSamples
+    # tables. journal_mode=WAL is persistent and is set once in init_db().
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    # Truncate the WAL back to 64 MiB after checkpoints so the append-heavy
+    # tables cannot grow the -wal file without bound.
+    conn.execute("PRAGMA journal_size_limit = 67108864;")
+    with _sqlite_lock:
+        _sqlite_connections.append(conn)
+        _sqlite_local.generation = _sqlite_generation
+    _sqlite_local.conn = conn
+    _sqlite_local.path = settings.database_path
+    return conn
+
+
+def close_connections() -> None:
     """
-    Returns schema SQL statements compatible with the current database type.
-    PostgreSQL uses SERIAL instead of AUTOINCREMENT, and different timestamp handling.
+    Close every reusable connection: all threads' SQLite handles (letting the
+    last one checkpoint the WAL) and the PostgreSQL pool. Connections are
+    reopened on the next get_connection().
     """
-    if settings.database_type == "postgresql":
-        return _POSTGRES_SCHEMA_STATEMENTS
-    else:
-        return _SQLITE_SCHEMA_STATEMENTS
+    global _pg_pool, _sqlite_generation
+    with _sqlite_lock:
+        _sqlite_generation += 1
+        while _sqlite_connections:
+            _sqlite_connections.pop().close()
+    with _pg_pool_lock:
+        if _pg_pool is not None:
+            _pg_pool.closeall()
+            _pg_pool = None
 
 
-# SQLite-specific schema
-_SQLITE_SCHEMA_STATEMENTS: Iterable[str] = (
-    """
-    CREATE TABLE IF NOT EXISTS ZoneStatus (
-        ZoneName TEXT PRIMARY KEY,
-        CurrentState TEXT NOT NULL CHECK (CurrentState IN ('ON', 'OFF')),
-        ZoneRoomTemp_F REAL,
-        PipeTemp_F REAL,
-        TargetSetpoint_F REAL,
-        ControlMode TEXT NOT NULL CHECK (ControlMode IN ('AUTO', 'MANUAL', 'THERMOSTAT')),
-        SetpointOverrideAt TEXT,
-        SetpointOverrideMode TEXT CHECK (SetpointOverrideMode IN ('boundary', 'permanent', 'timed')),
-        SetpointOverrideUntil TEXT,
-        UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-    );
-    """,
-    """
-    CREATE TABLE IF NOT EXISTS SystemStatus (
-        Id INTEGER PRIMARY KEY CHECK (Id = 1),
-        OutsideTemp_F REAL,
-        UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-    );
-    """,
-    """
-    CREATE TABLE IF NOT EXISTS EventLog (
-        Id INTEGER PRIMARY KEY AUTOINCREMENT,
-        Timestamp TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        Source TEXT NOT NULL,
-        Event TEXT NOT NULL,
-        ZoneRoomTemp_F REAL,
-        PipeTemp_F REAL,
-        OutsideTemp_F REAL,
-        DurationSeconds REAL
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_eventlog_source_time ON EventLog (Source, Timestamp);",
-    "CREATE INDEX IF NOT EXISTS idx_eventlog_time ON EventLog (Timestamp DESC);",
-    """
-    CREATE TABLE IF NOT EXISTS TemperatureSamples (
-        Id INTEGER PRIMARY KEY AUTOINCREMENT,
-        Timestamp TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        ZoneName TEXT NOT NULL,
-        RoomTemp_F REAL,
-        PipeTemp_F REAL,
-        OutsideTemp_F REAL
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_samples_zone_time ON TemperatureSamples (ZoneName, Timestamp);",
-    "CREATE INDEX IF NOT EXISTS idx_samples_time ON TemperatureSamples (Timestamp DESC);",
+atexit.register(close_connections)
+
+
+@contextmanager
+def _get_pg_connection() -> Generator[Any, None, None]:
     """
-    CREATE TABLE IF NOT EXISTS ZoneSchedules (
-        Id INTEGER PRIMARY KEY AUTOINCREMENT,
-        ZoneName TEXT NOT NULL,
-        DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
-        StartTime TEXT NOT NULL,
-        EndTime TEXT NOT NULL,
-        Setpoint_F REAL NOT NULL,
-        Enabled INTEGER NOT NULL DEFAULT 1,
-        CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE (ZoneName, DayOfWeek, StartTime)
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_schedules_zone_day ON ZoneSchedules (ZoneName, DayOfWeek, StartTime);",
+    Borrow a pooled PostgreSQL connection and return it to the pool afterwards.
+    Anything left uncommitted when the block exits is rolled back.
     """
-    CREATE TABLE IF NOT EXISTS GlobalSchedule (
-        Id INTEGER PRIMARY KEY AUTOINCREMENT,
-        DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
-        StartTime TEXT NOT NULL,
-        EndTime TEXT NOT NULL,
-        Setpoint_F REAL NOT NULL,
-        Enabled INTEGER NOT NULL DEFAULT 1,
-        CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE (DayOfWeek, StartTime)
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_global_schedule ON GlobalSchedule (DayOfWeek, StartTime);",
+    try:
+        pool = _get_pg_pool()
+    except ImportError as exc:
+        raise RuntimeError("psycopg2 is required for PostgreSQL but not installed") from exc
+
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        if not conn.closed:
+            conn.rollback()
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def _get_sqlite_connection_cm() -> Generator[sqlite3.Connection, None, None]:
     """
-    CREATE TABLE IF NOT EXISTS SchedulePresets (
-        Id INTEGER PRIMARY KEY AUTOINCREMENT,
-        Name TEXT NOT NULL UNIQUE,
-        Description TEXT,
-        CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-    );
-    """,
+    Yield this thread's SQLite connection, rolling back anything left
+    uncommitted when the block exits.
     """
-    CREATE TABLE IF NOT EXISTS SchedulePresetEntries (
-        Id INTEGER PRIMARY KEY AUTOINCREMENT,
-        PresetId INTEGER NOT NULL,
-        DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
-        StartTime TEXT NOT NULL,
-        EndTime TEXT NOT NULL,
-        Setpoint_F REAL NOT NULL,
-        Enabled INTEGER NOT NULL DEFAULT 1,
-        CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE (PresetId, DayOfWeek, StartTime),
-        FOREIGN KEY (PresetId) REFERENCES SchedulePresets(Id) ON DELETE CASCADE
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_preset_entries ON SchedulePresetEntries (PresetId, DayOfWeek, StartTime);",
+    conn = _get_sqlite_connection()
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+
+
+# The database type is fixed for the life of the process, so the connection
+# context manager is picked once here instead of branching on every call.
+get_connection: Callable[[], ContextManager[Union[sqlite3.Connection, Any]]] = (
+    _get_pg_connection if settings.database_type == "postgresql" else _get_sqlite_connection_cm
 )
 
 
-# PostgreSQL-specific schema
-_POSTGRES_SCHEMA_STATEMENTS: Iterable[str] = (
-    """
-    CREATE TABLE IF NOT EXISTS ZoneStatus (
-        ZoneName TEXT PRIMARY KEY,
-        CurrentState TEXT NOT NULL CHECK (CurrentState IN ('ON', 'OFF')),
-        ZoneRoomTemp_F REAL,
-        PipeTemp_F REAL,
-        TargetSetpoint_F REAL,
-        ControlMode TEXT NOT NULL CHECK (ControlMode IN ('AUTO', 'MANUAL', 'THERMOSTAT')),
-        SetpointOverrideAt TIMESTAMP,
-        SetpointOverrideMode TEXT CHECK (SetpointOverrideMode IN ('boundary', 'permanent', 'timed')),
-        SetpointOverrideUntil TIMESTAMP,
-        UpdatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-    );
-    """,
-    """
-    CREATE TABLE IF NOT EXISTS SystemStatus (
-        Id INTEGER PRIMARY KEY CHECK (Id = 1),
-        OutsideTemp_F REAL,
-        UpdatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-    );
-    """,
-    """
-    CREATE TABLE IF NOT EXISTS EventLog (
-        Id SERIAL PRIMARY KEY,
-        Timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        Source TEXT NOT NULL,
-        Event TEXT NOT NULL,
-        ZoneRoomTemp_F REAL,
-        PipeTemp_F REAL,
-        OutsideTemp_F REAL,
-        DurationSeconds REAL
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_eventlog_source_time ON EventLog (Source, Timestamp);",
-    "CREATE INDEX IF NOT EXISTS idx_eventlog_time ON EventLog (Timestamp DESC);",
-    """
-    CREATE TABLE IF NOT EXISTS TemperatureSamples (
-        Id SERIAL PRIMARY KEY,
-        Timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        ZoneName TEXT NOT NULL,
-        RoomTemp_F REAL,
-        PipeTemp_F REAL,
-        OutsideTemp_F REAL
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_samples_zone_time ON TemperatureSamples (ZoneName, Timestamp);",
-    "CREATE INDEX IF NOT EXISTS idx_samples_time ON TemperatureSamples (Timestamp DESC);",
+# Bump whenever the schema statements or the _ensure_* migrations change so
+# existing databases run the DDL again on their next init_db().
+SCHEMA_VERSION = 8
+
+
+def _get_schema_script() -> str:
     """
-    CREATE TABLE IF NOT EXISTS ZoneSchedules (
-        Id SERIAL PRIMARY KEY,
-        ZoneName TEXT NOT NULL,
-        DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
-        StartTime TEXT NOT NULL,
-        EndTime TEXT NOT NULL,
-        Setpoint_F REAL NOT NULL,
-        Enabled INTEGER NOT NULL DEFAULT 1,
-        CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE (ZoneName, DayOfWeek, StartTime)
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_schedules_zone_day ON ZoneSchedules (ZoneName, DayOfWeek, StartTime);",
+    Returns the schema SQL script compatible with the current database type.
+    PostgreSQL uses SERIAL instead of AUTOINCREMENT, and different timestamp handling.
     """
-    CREATE TABLE IF NOT EXISTS GlobalSchedule (
-        Id SERIAL PRIMARY KEY,
-        DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
-        StartTime TEXT NOT NULL,
-        EndTime TEXT NOT NULL,
-        Setpoint_F REAL NOT NULL,
-        Enabled INTEGER NOT NULL DEFAULT 1,
-        CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE (DayOfWeek, StartTime)
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_global_schedule ON GlobalSchedule (DayOfWeek, StartTime);",
+    if settings.database_type == "postgresql":
+        return _load_schema("schema_pg.sql")
+    else:
+        return _load_schema("schema_sqlite.sql")
+
+
+@lru_cache(maxsize=None)
+def _load_schema(filename: str) -> str:
     """
-    CREATE TABLE IF NOT EXISTS SchedulePresets (
-        Id SERIAL PRIMARY KEY,
-        Name TEXT NOT NULL UNIQUE,
-        Description TEXT,
-        CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-    );
-    """,
+    Read a schema file shipped next to this module. Only read when init_db()
+    actually has DDL to run, then cached as one script string.
     """
-    CREATE TABLE IF NOT EXISTS SchedulePresetEntries (
-        Id SERIAL PRIMARY KEY,
-        PresetId INTEGER NOT NULL,
-        DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
-        StartTime TEXT NOT NULL,
-        EndTime TEXT NOT NULL,
-        Setpoint_F REAL NOT NULL,
-        Enabled INTEGER NOT NULL DEFAULT 1,
-        CreatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UpdatedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        UNIQUE (PresetId, DayOfWeek, StartTime),
-        FOREIGN KEY (PresetId) REFERENCES SchedulePresets(Id) ON DELETE CASCADE
-    );
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_preset_entries ON SchedulePresetEntries (PresetId, DayOfWeek, StartTime);",
-)
+    return resources.files(__package__).joinpath(filename).read_text(encoding="utf-8")
 
 
 def _ensure_zone_status_control_mode(conn: Union[sqlite3.Connection, Any]) -> None:
@@ -289,7 +203,7 @@ def _ensure_zone_status_control_mode(conn: Union[sqlite3.Connection, Any]) -> No
     ).fetchone()
     if not row:
         return
-    create_sql = row["sql"] if isinstance(row, dict) else row[0]
+    create_sql = row[0]
     if create_sql and "THERMOSTAT" in create_sql:
         return
 
@@ -303,7 +217,7 @@ def _ensure_zone_status_control_mode(conn: Union[sqlite3.Connection, Any]) -> No
             TargetSetpoint_F REAL,
             ControlMode TEXT NOT NULL CHECK (ControlMode IN ('AUTO', 'MANUAL', 'THERMOSTAT')),
             UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-        );
+        ) WITHOUT ROWID;
         """
     )
     conn.execute(
@@ -335,200 +249,263 @@ def _ensure_zone_status_control_mode(conn: Union[sqlite3.Connection, Any]) -> No
     conn.execute("ALTER TABLE ZoneStatus_new RENAME TO ZoneStatus;")
 
 
-def _ensure_duration_seconds_column(conn: Union[sqlite3.Connection, Any]) -> None:
-    """Add DurationSeconds column to EventLog if it doesn't exist."""
-    if settings.database_type == "postgresql":
-        # Use PostgreSQL syntax to add column if not exists
-        cursor = conn.cursor()
-        cursor.execute("""
-            DO $$
-            BEGIN
-                BEGIN
-                    ALTER TABLE EventLog ADD COLUMN DurationSeconds REAL;
-                EXCEPTION
-                    WHEN duplicate_column THEN NULL;
-                END;
-            END $$;
-        """)
-        cursor.close()
-    else:
-        # SQLite syntax
-        try:
-            conn.execute("ALTER TABLE EventLog ADD COLUMN DurationSeconds REAL;")
-        except sqlite3.OperationalError as exc:
-            if "duplicate column name" not in str(exc).lower():
-                raise
+# Columns added after the original schema: (table, column, SQLite type, PostgreSQL type).
+# SQLite cannot add a CHECK constraint via ALTER TABLE, so only PostgreSQL gets one.
+_ADDED_COLUMNS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("EventLog", "DurationSeconds", "REAL", "REAL"),
+    ("ZoneStatus", "SetpointOverrideAt", "TEXT", "TIMESTAMP"),
+    (
+        "ZoneStatus",
+        "SetpointOverrideMode",
+        "TEXT",
+        "TEXT CHECK (SetpointOverrideMode IN ('boundary', 'permanent', 'timed'))",
+    ),
+    ("ZoneStatus", "SetpointOverrideUntil", "TEXT", "TIMESTAMP"),
+    ("ZoneStatus", "SortOrder", "INTEGER", "INTEGER"),
+)
 
 
-def _ensure_setpoint_override_column(conn: Union[sqlite3.Connection, Any]) -> None:
-    """Add SetpointOverrideAt column to ZoneStatus if it doesn't exist."""
+def _existing_columns(cursor: Any) -> Set[Tuple[str, str]]:
+    """Return (table, column) pairs, lower-cased, from a single catalog query."""
     if settings.database_type == "postgresql":
-        # Use PostgreSQL syntax to add column if not exists
-        cursor = conn.cursor()
-        cursor.execute("""
-            DO $$
-            BEGIN
-                BEGIN
-                    ALTER TABLE ZoneStatus ADD COLUMN SetpointOverrideAt TIMESTAMP;
-                EXCEPTION
-                    WHEN duplicate_column THEN NULL;
-                END;
-            END $$;
-        """)
-        cursor.close()
+        cursor.execute(
+            """
+            SELECT table_name, column_name
+            FROM information_schema.columns
+            WHERE table_schema = current_schema();
+            """
+        )
     else:
-        # SQLite syntax
-        try:
-            conn.execute("ALTER TABLE ZoneStatus ADD COLUMN SetpointOverrideAt TEXT;")
-        except sqlite3.OperationalError as exc:
-            if "duplicate column name" not in str(exc).lower():
-                raise
+        cursor.execute(
+            """
+            SELECT m.name AS table_name, p.name AS column_name
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS p
+            WHERE m.type = 'table';
+            """
+        )
+    return {
+        (row["table_name"].lower(), row["column_name"].lower())
+        for row in fetch_all_dicts(cursor)
+    }
+
+
+def _ensure_added_columns(conn: Union[sqlite3.Connection, Any]) -> None:
+    """Add any columns from _ADDED_COLUMNS that the existing tables lack."""
+    cursor = conn.cursor()
+    have = _existing_columns(cursor)
+    is_postgres = settings.database_type == "postgresql"
+    for table, column, sqlite_type, postgres_type in _ADDED_COLUMNS:
+        if (table.lower(), column.lower()) in have:
+            continue
+        column_type = postgres_type if is_postgres else sqlite_type
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type};")
+    cursor.close()
+
+
+def _backfill_zone_sort_order(conn: Union[sqlite3.Connection, Any]) -> None:
+    """
+    Fill SortOrder for rows created before the column existed: zones sort by
+    their numeric suffix (Z1, Z2, ... Z14) and the Boiler row goes last.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        UPDATE ZoneStatus
+        SET SortOrder = CASE
+            WHEN ZoneName = 'Boiler' THEN 9999
+            ELSE CAST(SUBSTR(ZoneName, 2) AS INTEGER)
+        END
+        WHERE SortOrder IS NULL;
+        """
+    )
+    cursor.close()
 
 
-def _ensure_override_mode_column(conn: Union[sqlite3.Connection, Any]) -> None:
-    """Add SetpointOverrideMode column to ZoneStatus if it doesn't exist."""
+def _zone_sort_order(zone_name: str) -> int:
+    """Python twin of the backfill above, used when inserting new zone rows."""
+    if zone_name == "Boiler":
+        return 9999
+    digits = re.match(r"\d*", zone_name[1:]).group()
+    return int(digits) if digits else 0
+
+
+# New zones start OFF under AUTO control; temperatures and setpoint stay NULL.
+_SQLITE_INSERT_ZONE_SQL = (
+    "INSERT OR IGNORE INTO ZoneStatus (ZoneName, CurrentState, ControlMode, SortOrder) "
+    "VALUES (?, 'OFF', 'AUTO', ?);"
+)
+_POSTGRES_INSERT_ZONE_SQL = (
+    "INSERT INTO ZoneStatus (ZoneName, CurrentState, ControlMode, SortOrder) VALUES %s "
+    "ON CONFLICT (ZoneName) DO NOTHING;"
+)
+_POSTGRES_INSERT_ZONE_TEMPLATE = "(%s, 'OFF', 'AUTO', %s)"
+
+# A single row acts as a key/value store for outdoor metrics.
+_SQLITE_INSERT_SYSTEM_SQL = (
+    "INSERT OR IGNORE INTO SystemStatus (Id, OutsideTemp_F) VALUES (1, NULL);"
+)
+_POSTGRES_INSERT_SYSTEM_SQL = (
+    "INSERT INTO SystemStatus (Id, OutsideTemp_F) VALUES (1, NULL) "
+    "ON CONFLICT (Id) DO NOTHING;"
+)
+
+
+# Every row bootstrap_zone_rows() guarantees: the configured zones plus the
+# Boiler sentinel. Zone names are fixed once settings load, so build it once.
+_BOOTSTRAP_ZONE_ROWS: Tuple[Tuple[str, int], ...] = tuple(
+    (zone, _zone_sort_order(zone)) for zone in (*settings.zone_names, "Boiler")
+)
+
+
+def _bootstrap_sqlite(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+    cursor.executemany(_SQLITE_INSERT_ZONE_SQL, _BOOTSTRAP_ZONE_ROWS)
+    cursor.execute(_SQLITE_INSERT_SYSTEM_SQL)
+    cursor.close()
+
+
+def _bootstrap_pg(conn: Any) -> None:
+    import psycopg2.extras
+
+    cursor = conn.cursor()
+    # psycopg2's executemany is one round-trip per row; execute_values
+    # sends every zone in a single multi-row INSERT.
+    psycopg2.extras.execute_values(
+        cursor,
+        _POSTGRES_INSERT_ZONE_SQL,
+        _BOOTSTRAP_ZONE_ROWS,
+        template=_POSTGRES_INSERT_ZONE_TEMPLATE,
+    )
+    cursor.execute(_POSTGRES_INSERT_SYSTEM_SQL)
+    cursor.close()
+
+
+# Ensure that each zone (plus the special Boiler row) exists exactly once.
+# Existing rows are left untouched by the database's conflict handling.
+bootstrap_zone_rows: Callable[[Union[sqlite3.Connection, Any]], None] = (
+    _bootstrap_pg if settings.database_type == "postgresql" else _bootstrap_sqlite
+)
+
+
+def _get_schema_version(conn: Union[sqlite3.Connection, Any]) -> int:
+    """Return the schema version recorded by the last completed init_db()."""
     if settings.database_type == "postgresql":
         cursor = conn.cursor()
-        cursor.execute("""
-            DO $$
-            BEGIN
-                BEGIN
-                    ALTER TABLE ZoneStatus ADD COLUMN SetpointOverrideMode TEXT
-                    CHECK (SetpointOverrideMode IN ('boundary', 'permanent', 'timed'));
-                EXCEPTION
-                    WHEN duplicate_column THEN NULL;
-                END;
-            END $$;
-        """)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS SchemaMeta (
+                Id INTEGER PRIMARY KEY CHECK (Id = 1),
+                Version INTEGER NOT NULL
+            );
+            """
+        )
+        cursor.execute("SELECT Version FROM SchemaMeta WHERE Id = 1;")
+        row = cursor.fetchone()
         cursor.close()
-    else:
-        # SQLite syntax - note: can't add CHECK constraint via ALTER TABLE
-        try:
-            conn.execute("ALTER TABLE ZoneStatus ADD COLUMN SetpointOverrideMode TEXT;")
-        except sqlite3.OperationalError as exc:
-            if "duplicate column name" not in str(exc).lower():
-                raise
+        return row["version"] if row else 0
+
+    row = conn.execute("PRAGMA user_version;").fetchone()
+    return row[0] if row else 0
 
 
-def _ensure_override_until_column(conn: Union[sqlite3.Connection, Any]) -> None:
-    """Add SetpointOverrideUntil column to ZoneStatus if it doesn't exist."""
+def _set_schema_version(conn: Union[sqlite3.Connection, Any]) -> None:
     if settings.database_type == "postgresql":
         cursor = conn.cursor()
-        cursor.execute("""
-            DO $$
-            BEGIN
-                BEGIN
-                    ALTER TABLE ZoneStatus ADD COLUMN SetpointOverrideUntil TIMESTAMP;
-                EXCEPTION
-                    WHEN duplicate_column THEN NULL;
-                END;
-            END $$;
-        """)
+        cursor.execute(
+            """
+            INSERT INTO SchemaMeta (Id, Version) VALUES (1, %s)
+            ON CONFLICT (Id) DO UPDATE SET Version = EXCLUDED.Version;
+            """,
+            (SCHEMA_VERSION,),
+        )
         cursor.close()
     else:
-        # SQLite syntax
-        try:
-            conn.execute("ALTER TABLE ZoneStatus ADD COLUMN SetpointOverrideUntil TEXT;")
-        except sqlite3.OperationalError as exc:
-            if "duplicate column name" not in str(exc).lower():
-                raise
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
 
 
-def bootstrap_zone_rows(conn: Union[sqlite3.Connection, Any]) -> None:
+def _run_statements(conn: Union[sqlite3.Connection, Any], script: str) -> None:
     """
-    Ensure that each zone (plus the special Boiler row) exists exactly once.
+    Run a script's statements one by one inside the transaction _run_script
+    opened; executescript would commit it first.
     """
     cursor = conn.cursor()
-    cursor.execute("SELECT ZoneName FROM ZoneStatus;")
-    existing = cursor.fetchall()
-    # Handle both dict-style (RealDictRow/SQLite dict_factory) and tuple results
-    # PostgreSQL returns lowercase column names, SQLite preserves case
-    if existing and isinstance(existing[0], dict):
-        # Try both ZoneName and zonename for compatibility
-        if "ZoneName" in existing[0]:
-            existing_names = {row["ZoneName"] for row in existing}
-        else:
-            existing_names = {row["zonename"] for row in existing}
-    else:
-        existing_names = {row[0] for row in existing}
-
-    rows_to_insert = [
-        (
-            zone,
-            "OFF",
-            None,
-            None,
-            None,
-            "AUTO",
-        )
-        for zone in settings.zone_names
-        if zone not in existing_names
-    ]
-
-    if "Boiler" not in existing_names:
-        rows_to_insert.append(("Boiler", "OFF", None, None, None, "AUTO"))
-
-    if rows_to_insert:
-        cursor.executemany(
-            """
-            INSERT INTO ZoneStatus (
-                ZoneName,
-                CurrentState,
-                ZoneRoomTemp_F,
-                PipeTemp_F,
-                TargetSetpoint_F,
-                ControlMode
-            )
-            VALUES (%s, %s, %s, %s, %s, %s);
-            """ if settings.database_type == "postgresql" else """
-            INSERT INTO ZoneStatus (
-                ZoneName,
-                CurrentState,
-                ZoneRoomTemp_F,
-                PipeTemp_F,
-                TargetSetpoint_F,
-                ControlMode
-            )
-            VALUES (?, ?, ?, ?, ?, ?);
-            """,
-            rows_to_insert,
-        )
+    for statement in script.split(";"):
+        if statement.strip():
+            cursor.execute(statement)
+    cursor.close()
 
-    cursor.execute("SELECT Id FROM SystemStatus WHERE Id = 1;")
-    system_row = cursor.fetchone()
-    if not system_row:
-        # A single row acts as a key/value store for outdoor metrics.
-        if settings.database_type == "postgresql":
-            cursor.execute(
-                "INSERT INTO SystemStatus (Id, OutsideTemp_F) VALUES (1, NULL);"
-            )
-        else:
-            cursor.execute(
-                "INSERT INTO SystemStatus (Id, OutsideTemp_F) VALUES (1, NULL);"
-            )
 
-    cursor.close()
+def _run_script(conn: Union[sqlite3.Connection, Any], script: str) -> None:
+    """
+    Run a multi-statement DDL script inside a transaction that stays open
+    until the caller commits, so the catalog is synced once.
+    """
+    if settings.database_type == "sqlite":
+        # sqlite3 does not open a transaction for DDL on its own;
+        # executescript leaves the explicit BEGIN open for the rest.
+        # IMMEDIATE takes the write lock up front so two workers
+        # starting together cannot deadlock upgrading a read lock.
+        conn.executescript("BEGIN IMMEDIATE;\n" + script)
+    else:
+        # psycopg2 already wraps everything up to commit() in one
+        # transaction; send the whole script in a single execute too.
+        cursor = conn.cursor()
+        cursor.execute(script)
+        cursor.close()
 
 
-def init_db() -> None:
+def init_db(create_indexes: bool = True) -> None:
     """
     Create schema (if needed) and populate rows that the application expects.
+    DDL and column migrations are skipped when the stored schema version
+    already matches SCHEMA_VERSION.
+
+    Bulk loaders can pass create_indexes=False to fill a fresh database before
+    indexing it, then call finalize_indexes(). The schema version is only
+    recorded once the indexes exist, so a later plain init_db() still builds
+    them if the load never finishes.
     """
     with get_connection() as conn:
-        cursor = conn.cursor()
+        if settings.database_type == "sqlite":
+            # WAL lets dashboard reads proceed while the control loop writes;
+            # the mode is stored in the database file, so set it once here.
+            conn.execute("PRAGMA journal_mode = WAL;")
+
+        migrated = _get_schema_version(conn) != SCHEMA_VERSION
+        if migrated:
+            # Run all DDL, migrations and the version bump in one transaction.
+            _run_script(conn, _get_schema_script())
+
+            _ensure_zone_status_control_mode(conn)
+            _ensure_added_columns(conn)
+            _backfill_zone_sort_order(conn)
+            if create_indexes:
+                # After the migrations, so indexes may cover added columns.
+                _run_statements(conn, _load_schema("indexes.sql"))
+                _set_schema_version(conn)
 
-        for statement in _get_schema_statements():
-            cursor.execute(statement)
+        bootstrap_zone_rows(conn)
+        conn.commit()
 
-        _ensure_zone_status_control_mode(conn)
-        _ensure_duration_seconds_column(conn)
-        _ensure_setpoint_override_column(conn)
-        _ensure_override_mode_column(conn)
-        _ensure_override_until_column(conn)
+        if migrated and create_indexes and settings.database_type == "sqlite":
+            # Refresh planner statistics for the freshly created indexes.
+            conn.execute("PRAGMA optimize;")
 
-        bootstrap_zone_rows(conn)
+
+def finalize_indexes() -> None:
+    """
+    Create the secondary indexes after a bulk load started with
+    init_db(create_indexes=False), gather planner statistics, and record the
+    schema version.
+    """
+    with get_connection() as conn:
+        _run_script(conn, _load_schema("indexes.sql") + "\nANALYZE;")
+        _set_schema_version(conn)
         conn.commit()
-        cursor.close()
+
+        if settings.database_type == "sqlite":
+            conn.execute("PRAGMA optimize;")
 
 
 if __name__ == "__main__":
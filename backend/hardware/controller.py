@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
-from typing import Dict, Iterable, Mapping
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 
 class BaseHardwareController(ABC):
@@ -47,6 +47,16 @@ class BaseHardwareController(ABC):
         for zone, state in desired.items():
             self.set_zone_state(zone, state)
 
+    def read_all_temperatures(self) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """
+        Read (room, pipe) temperatures for every known zone in one call.
+        Controllers that can sample all sensors at once should override this.
+        """
+        return {
+            zone: (self.read_zone_temperature(zone), self.read_pipe_temperature(zone))
+            for zone in self.get_zone_states()
+        }
+
 
 class MockHardwareController(BaseHardwareController):
     """
@@ -55,40 +65,53 @@ class MockHardwareController(BaseHardwareController):
     """
 
     def __init__(self, zones: Iterable[str]):
-        # Keep an in-memory dictionary that mirrors the relay states.
-        self._states: Dict[str, bool] = {zone: False for zone in zones}
+        # Per-zone data is kept as parallel lists indexed by position so the
+        # batch reader can walk them together instead of probing three dicts.
+        self._zones: Tuple[str, ...] = tuple(dict.fromkeys(zones))
+        self._zone_index: Dict[str, int] = {zone: i for i, zone in enumerate(self._zones)}
+        # Relay states that mirror the hardware outputs.
+        self._on: List[bool] = [False] * len(self._zones)
+        # Relays switched for zones without simulated sensors (e.g. Boiler).
+        self._extra_states: Dict[str, bool] = {}
+        # Private generator so the simulation neither shares nor reseeds the
+        # module-level random state; bound once to skip the attribute lookups.
+        self._rng = random.Random()
+        self._uniform = self._rng.uniform
         # Generate base temperatures for each zone (simulate different room temps)
-        self._base_room_temps: Dict[str, float] = {
-            zone: random.uniform(65.0, 72.0) for zone in zones
-        }
+        self._base_room: List[float] = [self._uniform(65.0, 72.0) for _ in self._zones]
         # Pipe temps are warmer when zone is ON
-        self._base_pipe_temps: Dict[str, float] = {
-            zone: random.uniform(75.0, 85.0) for zone in zones
-        }
+        self._base_pipe: List[float] = [self._uniform(75.0, 85.0) for _ in self._zones]
 
     def set_zone_state(self, zone: str, is_on: bool) -> None:
         # Update the cached state; a real implementation would toggle GPIO pins here.
-        self._states[zone] = is_on
+        index = self._zone_index.get(zone)
+        if index is None:
+            self._extra_states[zone] = is_on
+        else:
+            self._on[index] = is_on
 
     def get_zone_states(self) -> Mapping[str, bool]:
-        # Return a copy so callers cannot mutate our internal dict.
-        return dict(self._states)
+        # Build a fresh dict so callers cannot mutate our internal state.
+        states = dict(zip(self._zones, self._on, strict=True))
+        states.update(self._extra_states)
+        return states
 
     def read_zone_temperature(self, zone: str) -> float | None:
         """
         Return simulated room temperature with small random variation.
         Zones that are ON will gradually warm up.
         """
-        if zone not in self._base_room_temps:
+        index = self._zone_index.get(zone)
+        if index is None:
             return None
 
-        base_temp = self._base_room_temps[zone]
+        base_temp = self._base_room[index]
         # Add small random variation (-0.5 to +0.5 degrees)
-        variation = random.uniform(-0.5, 0.5)
+        variation = self._uniform(-0.5, 0.5)
 
         # If zone is ON, add 2-3 degrees to simulate heating
-        if self._states.get(zone, False):
-            heating_offset = random.uniform(2.0, 3.0)
+        if self._on[index]:
+            heating_offset = self._uniform(2.0, 3.0)
             return round(base_temp + heating_offset + variation, 1)
 
         return round(base_temp + variation, 1)
@@ -98,15 +121,38 @@ class MockHardwareController(BaseHardwareController):
         Return simulated pipe temperature.
         Pipes are much warmer when zone valve is open (ON).
         """
-        if zone not in self._base_pipe_temps:
+        index = self._zone_index.get(zone)
+        if index is None:
             return None
 
         # If zone is ON, pipe temp is hot (120-140°F)
-        if self._states.get(zone, False):
-            return round(random.uniform(120.0, 140.0), 1)
+        if self._on[index]:
+            return round(self._uniform(120.0, 140.0), 1)
 
         # If zone is OFF, pipe temp is close to room temp
-        base_temp = self._base_pipe_temps[zone]
-        variation = random.uniform(-2.0, 2.0)
+        base_temp = self._base_pipe[index]
+        variation = self._uniform(-2.0, 2.0)
         return round(base_temp + variation, 1)
 
+    def read_all_temperatures(self) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """
+        Simulate every zone's room and pipe reading in a single pass over the
+        parallel per-zone lists. Same distributions as the per-zone readers.
+        """
+        uniform = self._uniform
+        readings: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        for zone, is_on, base_room, base_pipe in zip(
+            self._zones, self._on, self._base_room, self._base_pipe, strict=True
+        ):
+            variation = uniform(-0.5, 0.5)
+            if is_on:
+                readings[zone] = (
+                    round(base_room + uniform(2.0, 3.0) + variation, 1),
+                    round(uniform(120.0, 140.0), 1),
+                )
+            else:
+                readings[zone] = (
+                    round(base_room + variation, 1),
+                    round(base_pipe + uniform(-2.0, 2.0), 1),
+                )
+        return readings
@@ -0,0 +1,17 @@
+-- Secondary indexes shared by the SQLite and PostgreSQL schemas. Kept apart
+-- from the tables so bulk loads can insert first and index afterwards, and
+-- run after the column migrations so they can cover added columns.
+-- Bump SCHEMA_VERSION in database.py after editing this file.
+
+-- The event indexes carry Event as a trailing column so fetch_events can drop
+-- SAMPLE rows (Event NOT IN ...) from the index before reading table rows.
+DROP INDEX IF EXISTS idx_eventlog_source_time;
+DROP INDEX IF EXISTS idx_eventlog_time;
+CREATE INDEX IF NOT EXISTS idx_eventlog_source_time_event ON EventLog (Source, Timestamp, Event);
+CREATE INDEX IF NOT EXISTS idx_eventlog_time_event ON EventLog (Timestamp DESC, Event);
+CREATE INDEX IF NOT EXISTS idx_samples_zone_time ON TemperatureSamples (ZoneName, Timestamp);
+CREATE INDEX IF NOT EXISTS idx_samples_time ON TemperatureSamples (Timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_schedules_zone_day ON ZoneSchedules (ZoneName, DayOfWeek, StartTime);
+CREATE INDEX IF NOT EXISTS idx_global_schedule ON GlobalSchedule (DayOfWeek, StartTime);
+CREATE INDEX IF NOT EXISTS idx_preset_entries ON SchedulePresetEntries (PresetId, DayOfWeek, StartTime);
+CREATE INDEX IF NOT EXISTS idx_zone_sort_order ON ZoneStatus (SortOrder);
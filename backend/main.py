@@ -5,17 +5,35 @@ FastAPI application entry point.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import re
 import time
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
+from jinja2 import Template
+from pydantic import AfterValidator, TypeAdapter, WithJsonSchema
 
 from .config import settings
-from .database import init_db
+from .database import close_connections, init_db
 from .hardware import MockHardwareController
 from .schemas import (
     BoilerEventPayload,
@@ -40,8 +58,24 @@ from .schemas import (
 )
 from .services import EventService, ZoneService
 
+logger = logging.getLogger(__name__)
 request_logger = logging.getLogger("boiler.requests")
 
+# orjson serializes the large zone/history/event lists several times faster
+# than the stdlib encoder; fall back to the default if it is not installed.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:  # pragma: no cover - orjson unavailable
+    DefaultJSONResponse = JSONResponse  # type: ignore
+
+# Optional binary encoding for the history batch endpoint; clients opt in with
+# "Accept: application/msgpack" and everyone else keeps getting JSON.
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - ormsgpack is optional
+    ormsgpack = None  # type: ignore
+
 # Best-effort timezone support for startup logging
 try:  # Python 3.9+
     from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # type: ignore
@@ -53,16 +87,66 @@ except Exception:  # pragma: no cover - Python < 3.9
         ZoneInfoNotFoundError = Exception  # type: ignore
 
 
+# The hot read endpoints below return models the services have already
+# validated. Dumping them straight to JSON bytes with pydantic-core skips
+# FastAPI's second validation pass against response_model (which stays on the
+# routes for the OpenAPI schema).
+_ZONE_LIST_ADAPTER = TypeAdapter(List[ZoneStatusModel])
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventLogModel])
+_SCHEDULE_LIST_ADAPTER = TypeAdapter(List[ZoneScheduleEntryModel])
+_PRESET_LIST_ADAPTER = TypeAdapter(List[SchedulePresetSummaryModel])
+_STATS_LIST_ADAPTER = TypeAdapter(List[ZoneStatisticsModel])
+
+
+def _json_bytes_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+def _etag_json_response(request: Request, content: Union[bytes, str]) -> Response:
+    """
+    JSON response tagged with a hash of its body. Polling clients that send the
+    tag back in If-None-Match get an empty 304 when nothing changed. The tag is
+    derived from the content rather than a mutation counter because the
+    auto-control tick and sensor sampling update zones outside explicit edits.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    etag = f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+# Calendar-day query parameters share one compiled pattern instead of each
+# route carrying its own Query(pattern=...) constraint.
+_DAY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _check_day(value: str) -> str:
+    if _DAY_RE.fullmatch(value) is None:
+        raise ValueError("day must be formatted as YYYY-MM-DD")
+    return value
+
+
+DayStr = Annotated[
+    str,
+    AfterValidator(_check_day),
+    WithJsonSchema({"type": "string", "pattern": r"^\d{4}-\d{2}-\d{2}$"}),
+]
+
+
+_PAGE_TEMPLATE_NAMES = ("index.html", "graphs.html", "scheduler.html", "metrics.html")
+
+
 def create_app() -> FastAPI:
     """
     Build and configure the FastAPI application. We keep everything in this
     factory so Uvicorn (and unit tests) can import `app` without side effects.
     """
-    app = FastAPI(title="Boiler Controller", version="0.1.0")
-
-    templates = Jinja2Templates(directory="frontend/templates")
-    app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
-
     # For now we instantiate the mock hardware layer. Swap this out for a
     # GPIO-specific implementation when deploying to the Raspberry Pi.
     hardware = MockHardwareController(settings.zone_names)
@@ -70,37 +154,38 @@ def create_app() -> FastAPI:
     zone_service = ZoneService(hardware=hardware, event_service=event_service)
 
     async def auto_control_loop() -> None:
-        """Background task that reevaluates AUTO zones periodically."""
-        interval = 10  # seconds
+        """
+        Background task that reevaluates AUTO zones periodically. The tick does
+        blocking database/hardware work, so it runs in a worker thread to keep
+        HTTP requests flowing; the loop re-checks sooner while zones are switching.
+        """
+        interval = 10.0  # seconds between ticks when nothing is changing
+        busy_interval = 5.0  # seconds between ticks after a zone switched
         await asyncio.sleep(2)  # short delay before first run
         while True:
+            started = time.monotonic()
+            next_interval = interval
             try:
-                zone_service.tick_auto_control()
+                if await asyncio.to_thread(zone_service.tick_auto_control):
+                    next_interval = busy_interval
             except Exception as exc:  # log and keep the loop alive
-                logging.getLogger(__name__).exception("auto_control_loop error: %s", exc)
-            await asyncio.sleep(interval)
+                logger.exception("auto_control_loop error: %s", exc)
+            # Keep a steady cadence measured from the start of each tick.
+            await asyncio.sleep(max(0.5, started + next_interval - time.monotonic()))
 
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        start_time = time.perf_counter()
-        response = await call_next(request)
-        duration = time.perf_counter() - start_time
-        request_logger.info(
-            "http path=%s status=%s duration=%.3fs",
-            request.url.path,
-            response.status_code,
-            duration,
-        )
-        return response
-
-    @app.on_event("startup")
-    async def startup_event() -> None:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         # Ensure schema exists before handling any HTTP requests.
         init_db()
-        # Store service objects on the app state for dependency injection.
+        # Compile the page templates (and the base they extend) now so the
+        # first page request does not pay for it; Jinja caches them after this.
+        for name in ("base.html", *_PAGE_TEMPLATE_NAMES):
+            templates.get_template(name)
+        # Keep the service objects reachable from the app state as well.
         app.state.zone_service = zone_service
         app.state.event_service = event_service
-        app.state.auto_task = asyncio.create_task(auto_control_loop())
+        auto_task = asyncio.create_task(auto_control_loop())
+        app.state.auto_task = auto_task
         # Determine active timezone (with graceful fallback for Windows without tzdata)
         configured_tz = settings.time_zone
         tz_active = configured_tz
@@ -121,40 +206,117 @@ def create_app() -> FastAPI:
             tz_active = "LOCAL-NAIVE"
             tz_note = "fallback:local"
         app.state.time_zone_active = tz_active
-        print(f"Time zone configured={configured_tz} active={tz_active} note={tz_note}")
-        print('Routes available:', [route.path for route in app.routes])
-
-    @app.on_event("shutdown")
-    async def shutdown_event() -> None:
-        task = getattr(app.state, "auto_task", None)
-        if task:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        logger.info(
+            "startup time_zone configured=%s active=%s note=%s", configured_tz, tz_active, tz_note
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("startup routes=%s", ",".join(route.path for route in app.routes))
+
+        yield
+
+        auto_task.cancel()
+        try:
+            await auto_task
+        except asyncio.CancelledError:
+            pass
+        close_connections()
+
+    app = FastAPI(
+        title="Boiler Controller",
+        version="0.1.0",
+        default_response_class=DefaultJSONResponse,
+        lifespan=lifespan,
+    )
+    # History, event and zone payloads are repetitive JSON; compressing them
+    # costs far less on the Pi than pushing the raw bytes over the network.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    templates = Jinja2Templates(directory="frontend/templates")
+    templates.env.auto_reload = settings.template_auto_reload
+    app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
 
-    def get_zone_service() -> ZoneService:
-        svc: ZoneService = app.state.zone_service
-        return svc
+    # Without auto-reload the page templates never change, so resolve them
+    # once here instead of looking them up on every request.
+    page_templates: Dict[str, Template] = {}
+    if not settings.template_auto_reload:
+        page_templates = {
+            name: templates.get_template(name)
+            for name in _PAGE_TEMPLATE_NAMES
+        }
+
+    # base.html appends ?v=<cache_version> to its asset URLs, so each restart
+    # hands browsers fresh URLs. While templates auto-reload (development) the
+    # assets may change without a restart, so they are only revalidated.
+    cache_version = int(time.time())
+    static_cache_control = (
+        "no-cache" if settings.template_auto_reload else "public, max-age=86400, immutable"
+    )
+
+    def render_page(name: str, context: Dict[str, Any]) -> HTMLResponse:
+        template = page_templates.get(name) or templates.get_template(name)
+        return HTMLResponse(template.render(context, cache_version=cache_version))
 
-    def get_event_service() -> EventService:
-        svc: EventService = app.state.event_service
-        return svc
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        # Static assets and disabled INFO logging skip the timing entirely.
+        if request.url.path.startswith("/static/"):
+            response = await call_next(request)
+            if response.status_code < 400:
+                response.headers["Cache-Control"] = (
+                    static_cache_control if request.query_params.get("v") else "no-cache"
+                )
+            return response
+        # Preflight and health-check traffic (OPTIONS/HEAD) is not logged either.
+        if request.method in ("OPTIONS", "HEAD") or not request_logger.isEnabledFor(
+            logging.INFO
+        ):
+            return await call_next(request)
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        duration = time.perf_counter() - start_time
+        request_logger.info(
+            "http path=%s status=%s duration=%.3fs",
+            request.url.path,
+            response.status_code,
+            duration,
+        )
+        return response
 
+    # History requests in flight, keyed by their full parameter set. The
+    # dashboard fires several identical requests at once (page load plus
+    # refresh timers); they share one worker-thread computation instead of
+    # each rebuilding the same history on the event loop.
+    history_inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+    async def coalesced_history(key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        pending = history_inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(asyncio.to_thread(compute))
+            history_inflight[key] = pending
+            pending.add_done_callback(lambda _: history_inflight.pop(key, None))
+        # shield: one client disconnecting must not cancel the shared work.
+        return await asyncio.shield(pending)
+
+    # Dependencies hand back the services captured by this factory. They are
+    # async so FastAPI calls them inline instead of via the threadpool. The
+    # polled read endpoints (zones, system, history, events) skip dependency
+    # resolution and use the captured services directly.
+    async def get_zone_service() -> ZoneService:
+        return zone_service
+
+    async def get_event_service() -> EventService:
+        return event_service
+
+    # The page handlers load zone and system state in worker threads so the
+    # queries overlap and stay off the event loop.
     @app.get("/", response_class=HTMLResponse)
     async def dashboard(request: Request) -> HTMLResponse:
-        zone_status = zone_service.list_zones(include_boiler=True)
-        system_status = zone_service.get_system_status()
-        selectable_zones = [
-            {
-                "zone": zone.zone_name,
-                "room": zone.room_name or zone.zone_name,
-            }
-            for zone in zone_status
-            if zone.zone_name != "Boiler"
-        ]
-        return templates.TemplateResponse(
+        zone_status, system_status = await asyncio.gather(
+            asyncio.to_thread(zone_service.list_zones, include_boiler=True),
+            asyncio.to_thread(zone_service.get_system_status),
+        )
+        selectable_zones = zone_service.get_selectable_zones(zone_status)
+        return render_page(
             "index.html",
             {
                 "request": request,
@@ -167,16 +329,12 @@ def create_app() -> FastAPI:
 
     @app.get("/graphs", response_class=HTMLResponse)
     async def graphs(request: Request) -> HTMLResponse:
-        zone_status = zone_service.list_zones(include_boiler=False)
-        system_status = zone_service.get_system_status()
-        selectable_zones = [
-            {
-                "zone": zone.zone_name,
-                "room": zone.room_name or zone.zone_name,
-            }
-            for zone in zone_status
-        ]
-        return templates.TemplateResponse(
+        zone_status, system_status = await asyncio.gather(
+            asyncio.to_thread(zone_service.list_zones, include_boiler=False),
+            asyncio.to_thread(zone_service.get_system_status),
+        )
+        selectable_zones = zone_service.get_selectable_zones(zone_status)
+        return render_page(
             "graphs.html",
             {
                 "request": request,
@@ -189,16 +347,9 @@ def create_app() -> FastAPI:
 
     @app.get("/scheduler", response_class=HTMLResponse)
     async def scheduler_page(request: Request) -> HTMLResponse:
-        zone_status = zone_service.list_zones(include_boiler=True)
-        selectable_zones = [
-            {
-                "zone": zone.zone_name,
-                "room": zone.room_name or zone.zone_name,
-            }
-            for zone in zone_status
-            if zone.zone_name != "Boiler"
-        ]
-        return templates.TemplateResponse(
+        zone_status = await asyncio.to_thread(zone_service.list_zones, include_boiler=True)
+        selectable_zones = zone_service.get_selectable_zones(zone_status)
+        return render_page(
             "scheduler.html",
             {
                 "request": request,
@@ -210,16 +361,12 @@ def create_app() -> FastAPI:
 
     @app.get("/metrics", response_class=HTMLResponse)
     async def metrics_page(request: Request) -> HTMLResponse:
-        zone_status = zone_service.list_zones(include_boiler=False)
-        selectable_zones = [
-            {
-                "zone": zone.zone_name,
-                "room": zone.room_name or zone.zone_name,
-            }
-            for zone in zone_status
-        ]
-        system_status = zone_service.get_system_status()
-        return templates.TemplateResponse(
+        zone_status, system_status = await asyncio.gather(
+            asyncio.to_thread(zone_service.list_zones, include_boiler=False),
+            asyncio.to_thread(zone_service.get_system_status),
+        )
+        selectable_zones = zone_service.get_selectable_zones(zone_status)
+        return render_page(
             "metrics.html",
             {
                 "request": request,
@@ -232,31 +379,32 @@ def create_app() -> FastAPI:
 
     @app.get("/api/zones", response_model=List[ZoneStatusModel])
     async def api_list_zones(
+        request: Request,
         include_boiler: bool = Query(False),
-        svc: ZoneService = Depends(get_zone_service),
-    ) -> List[ZoneStatusModel]:
+    ) -> Response:
         # When include_boiler is true the response also contains the boiler row.
-        return svc.list_zones(include_boiler=include_boiler)
+        zones = zone_service.list_zones(include_boiler=include_boiler)
+        return _etag_json_response(request, _ZONE_LIST_ADAPTER.dump_json(zones, by_alias=True))
 
     @app.get("/api/zones/stats", response_model=List[ZoneStatisticsModel])
     async def api_zone_stats(
-        window: str = Query("day", pattern="^(day|week|month)$"),
-        day: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+        window: Literal["day", "week", "month"] = Query("day"),
+        day: Optional[DayStr] = Query(None),
         svc: ZoneService = Depends(get_zone_service),
-    ) -> List[ZoneStatisticsModel]:
+    ) -> Response:
         try:
-            return svc.get_zone_statistics(window=window, day=day)
+            stats = svc.get_zone_statistics(window=window, day=day)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        return _json_bytes_response(_STATS_LIST_ADAPTER.dump_json(stats, by_alias=True))
 
     @app.get("/api/zones/{zone_name}", response_model=ZoneStatusModel)
-    async def api_get_zone(
-        zone_name: str, svc: ZoneService = Depends(get_zone_service)
-    ) -> ZoneStatusModel:
+    async def api_get_zone(zone_name: str) -> Response:
         try:
-            return svc.get_zone(zone_name)
+            zone = zone_service.get_zone(zone_name)
         except KeyError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+        return _json_bytes_response(zone.model_dump_json(by_alias=True))
 
     @app.patch("/api/zones/{zone_name}", response_model=ZoneStatusModel)
     async def api_update_zone(
@@ -317,11 +465,12 @@ def create_app() -> FastAPI:
         zone_name: str,
         include_global: bool = Query(False),
         svc: ZoneService = Depends(get_zone_service),
-    ) -> List[ZoneScheduleEntryModel]:
+    ) -> Response:
         try:
-            return svc.get_zone_schedule(zone_name, include_global=include_global)
+            schedule = svc.get_zone_schedule(zone_name, include_global=include_global)
         except KeyError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+        return _json_bytes_response(_SCHEDULE_LIST_ADAPTER.dump_json(schedule, by_alias=True))
 
     @app.put(
         "/api/zones/{zone_name}/schedule", response_model=List[ZoneScheduleEntryModel]
@@ -353,9 +502,13 @@ def create_app() -> FastAPI:
 
     @app.get("/api/schedule/default", response_model=List[ZoneScheduleEntryModel])
     async def api_get_default_schedule(
+        request: Request,
         svc: ZoneService = Depends(get_zone_service),
-    ) -> List[ZoneScheduleEntryModel]:
-        return svc.get_global_schedule()
+    ) -> Response:
+        schedule = svc.get_global_schedule()
+        return _etag_json_response(
+            request, _SCHEDULE_LIST_ADAPTER.dump_json(schedule, by_alias=True)
+        )
 
     @app.post("/api/zones/mode/away", response_model=List[ZoneStatusModel])
     async def api_apply_away_mode(
@@ -400,9 +553,13 @@ def create_app() -> FastAPI:
         response_model=List[SchedulePresetSummaryModel],
     )
     async def api_list_presets(
+        request: Request,
         svc: ZoneService = Depends(get_zone_service),
-    ) -> List[SchedulePresetSummaryModel]:
-        return svc.list_schedule_presets()
+    ) -> Response:
+        presets = svc.list_schedule_presets()
+        return _etag_json_response(
+            request, _PRESET_LIST_ADAPTER.dump_json(presets, by_alias=True)
+        )
 
     @app.post(
         "/api/schedule/presets",
@@ -464,59 +621,72 @@ def create_app() -> FastAPI:
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     @app.get("/api/system", response_model=SystemStatusModel)
-    async def api_system_status(
-        svc: ZoneService = Depends(get_zone_service),
-    ) -> SystemStatusModel:
-        return svc.get_system_status()
+    async def api_system_status(request: Request) -> Response:
+        system_status = zone_service.get_system_status()
+        return _etag_json_response(request, system_status.model_dump_json(by_alias=True))
 
     @app.get("/api/zones/{zone_name}/history", response_model=List[EventLogModel])
     async def api_zone_history(
         zone_name: str,
         hours: int = Query(24, ge=1, le=720),
         limit: int = Query(2000, ge=10, le=12000),
-        day: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+        day: Optional[DayStr] = Query(None),
         tz: str = Query("America/Denver"),
         span_days: int = Query(1, ge=1, le=31),
         max_samples: int = Query(4000, ge=200, le=20000),
-        svc: ZoneService = Depends(get_zone_service),
-    ) -> List[EventLogModel]:
+    ) -> Response:
         try:
-            return svc.get_zone_history(
-                zone_name,
-                hours=hours,
-                limit=limit,
-                day=day,
-                tz=tz,
-                span_days=span_days,
-                max_samples=max_samples,
+            history = await coalesced_history(
+                ("zone", zone_name, hours, limit, day, tz, span_days, max_samples),
+                partial(
+                    zone_service.get_zone_history,
+                    zone_name,
+                    hours=hours,
+                    limit=limit,
+                    day=day,
+                    tz=tz,
+                    span_days=span_days,
+                    max_samples=max_samples,
+                ),
             )
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        return _json_bytes_response(_EVENT_LIST_ADAPTER.dump_json(history, by_alias=True))
 
     @app.post("/api/zones/history/batch", response_model=ZoneHistoryBatchResponse)
     async def api_zone_history_batch(
+        request: Request,
         payload: ZoneHistoryBatchRequest,
         hours: int = Query(24, ge=1, le=720),
         limit: int = Query(2000, ge=10, le=12000),
-        day: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+        day: Optional[DayStr] = Query(None),
         tz: str = Query("America/Denver"),
         span_days: int = Query(1, ge=1, le=31),
         max_samples: int = Query(4000, ge=200, le=20000),
-        svc: ZoneService = Depends(get_zone_service),
-    ) -> ZoneHistoryBatchResponse:
+    ) -> Response:
         try:
-            histories = svc.get_zones_history_batch(
-                payload.zones,
-                hours=hours,
-                limit=limit,
-                day=day,
-                tz=tz,
-                span_days=span_days,
-                max_samples=max_samples,
+            histories = await coalesced_history(
+                ("batch", tuple(payload.zones), hours, limit, day, tz, span_days, max_samples),
+                partial(
+                    zone_service.get_zones_history_batch,
+                    payload.zones,
+                    hours=hours,
+                    limit=limit,
+                    day=day,
+                    tz=tz,
+                    span_days=span_days,
+                    max_samples=max_samples,
+                ),
             )
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
-        return ZoneHistoryBatchResponse(histories=histories)
+        batch = ZoneHistoryBatchResponse(histories=histories)
+        if ormsgpack is not None and "application/msgpack" in request.headers.get("accept", ""):
+            return Response(
+                content=ormsgpack.packb(batch.model_dump(mode="json", by_alias=True)),
+                media_type="application/msgpack",
+            )
+        return _json_bytes_response(batch.model_dump_json(by_alias=True))
 
     @app.get("/api/events", response_model=List[EventLogModel])
     async def api_events(
@@ -524,14 +694,15 @@ def create_app() -> FastAPI:
         since: Optional[str] = None,
         until: Optional[str] = None,
         limit: int = Query(200, ge=1, le=2000),
-        svc: EventService = Depends(get_event_service),
-    ) -> List[EventLogModel]:
-        return svc.list_events(
+    ) -> Response:
+        events = event_service.list_events(
             source=source,
             since=since,
             until=until,
             limit=limit,
+            cache=True,
         )
+        return _json_bytes_response(_EVENT_LIST_ADAPTER.dump_json(events, by_alias=True))
 
     return app
 
@@ -5,11 +5,13 @@ Data access layer for SQLite.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+import json
 import sqlite3
 import logging
 
-from .database import get_connection
+from .database import fetch_all_dicts, fetch_one_dict, get_connection
 from .config import settings
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,16 @@ def _execute_query(conn: sqlite3.Connection, query: str, params: tuple = ()) ->
     return conn.execute(query, params)
 
 
+@lru_cache(maxsize=128)
+def _update_sql(table: str, assignments: Tuple[str, ...], where: str) -> str:
+    """
+    UPDATE text for one combination of assigned columns. The partial updates
+    below only ever produce a handful of combinations, so each is built once
+    and the same string keeps hitting the connection's statement cache.
+    """
+    return f"UPDATE {table} SET {', '.join(assignments)} WHERE {where};"
+
+
 def _convert_postgresql_row(row, cursor):
     """Convert PostgreSQL row to match SQLite format with proper field name casing."""
     if hasattr(row, '_asdict'):  # Named tuple
@@ -42,22 +54,35 @@ def _convert_postgresql_row(row, cursor):
     return row_dict
 
 
+# Zone reads run on every dashboard poll; like the INSERTs further down they
+# are module constants so the statement cache always sees identical SQL text.
+# SortOrder is stored per row (see database._zone_sort_order) so neither
+# query evaluates an expression per row to order the zones.
+_LIST_ZONES_SQL = """
+    SELECT *
+    FROM ZoneStatus
+    WHERE ZoneName != ?
+    ORDER BY SortOrder
+"""
+
+_LIST_ALL_ZONES_SQL = """
+    SELECT *
+    FROM ZoneStatus
+    ORDER BY SortOrder
+"""
+
+_GET_ZONE_SQL = "SELECT * FROM ZoneStatus WHERE ZoneName = ?;"
+
+_GET_SYSTEM_SQL = "SELECT OutsideTemp_F, UpdatedAt FROM SystemStatus WHERE Id = 1;"
+
+
 def list_zone_status() -> List[Dict[str, Any]]:
     """
     Return current status rows for the 14 heating zones (Boiler excluded).
     """
     with get_connection() as conn:
-        cursor = _execute_query(
-            conn,
-            """
-            SELECT *
-            FROM ZoneStatus
-            WHERE ZoneName != ?
-            ORDER BY CAST(SUBSTR(ZoneName, 2) AS INTEGER)
-            """,
-            ("Boiler",)
-        )
-        rows = cursor.fetchall()
+        cursor = _execute_query(conn, _LIST_ZONES_SQL, ("Boiler",))
+        rows = fetch_all_dicts(cursor)
     return rows
 
 
@@ -66,11 +91,28 @@ def get_zone_status(zone_name: str) -> Optional[Dict[str, Any]]:
     Fetch a single zone row by its identifier (e.g., 'Z3' or 'Boiler').
     """
     with get_connection() as conn:
-        cursor = _execute_query(conn, "SELECT * FROM ZoneStatus WHERE ZoneName = ?;", (zone_name,))
-        row = cursor.fetchone()
+        cursor = _execute_query(conn, _GET_ZONE_SQL, (zone_name,))
+        row = fetch_one_dict(cursor)
     return row
 
 
+def get_zone_names_in(names: Iterable[str]) -> Set[str]:
+    """
+    Return which of the given zone names exist, using a single query.
+    """
+    names = tuple(names)
+    if not names:
+        return set()
+    placeholders = ",".join("?" for _ in names)
+    with get_connection() as conn:
+        cursor = _execute_query(
+            conn,
+            f"SELECT ZoneName FROM ZoneStatus WHERE ZoneName IN ({placeholders});",
+            names,
+        )
+        return {row["ZoneName"] for row in fetch_all_dicts(cursor)}
+
+
 def update_zone_status(
     zone_name: str,
     *,
@@ -107,15 +149,15 @@ def update_zone_status(
     if setpoint_override_at is not None:
         assignments.append("SetpointOverrideAt = ?")
         params.append(setpoint_override_at.isoformat())
-        logger.info(f"Setting override_at: {setpoint_override_at.isoformat()}")
+        logger.info("Setting override_at: %s", params[-1])
     if setpoint_override_mode is not None:
         assignments.append("SetpointOverrideMode = ?")
         params.append(setpoint_override_mode)
-        logger.info(f"Setting override_mode: {setpoint_override_mode}")
+        logger.info("Setting override_mode: %s", setpoint_override_mode)
     if setpoint_override_until is not None:
         assignments.append("SetpointOverrideUntil = ?")
         params.append(setpoint_override_until.isoformat())
-        logger.info(f"Setting override_until: {setpoint_override_until.isoformat()}")
+        logger.info("Setting override_until: %s", params[-1])
     if clear_override:
         assignments.append("SetpointOverrideAt = NULL")
         assignments.append("SetpointOverrideMode = NULL")
@@ -137,29 +179,39 @@ def update_zone_status(
     with get_connection() as conn:
         _execute_query(
             conn,
-            f"UPDATE ZoneStatus SET {', '.join(assignments)} WHERE ZoneName = ?;",
+            _update_sql("ZoneStatus", tuple(assignments), "ZoneName = ?"),
             tuple(params),
         )
         conn.commit()
 
 
-def list_all_zone_rows() -> List[Dict[str, Any]]:
+def update_zone_room_temps(updates: Iterable[Tuple[str, float]]) -> None:
     """
-    Fetch status for every zone, including the boiler row.
+    Store new room temperatures for several zones, given as (zone_name,
+    room_temp_f) pairs, with one executemany and one commit.
     """
+    params = [(room_temp_f, zone_name) for zone_name, room_temp_f in updates]
+    if not params:
+        return
     with get_connection() as conn:
-        cursor = _execute_query(
-            conn,
-            """
-            SELECT *
-            FROM ZoneStatus
-            ORDER BY CASE
-                WHEN ZoneName = 'Boiler' THEN 9999
-                ELSE CAST(SUBSTR(ZoneName, 2) AS INTEGER)
-            END
+        conn.executemany(
             """
+            UPDATE ZoneStatus
+            SET ZoneRoomTemp_F = ?, UpdatedAt = CURRENT_TIMESTAMP
+            WHERE ZoneName = ?;
+            """,
+            params,
         )
-        rows = cursor.fetchall()
+        conn.commit()
+
+
+def list_all_zone_rows() -> List[Dict[str, Any]]:
+    """
+    Fetch status for every zone, including the boiler row.
+    """
+    with get_connection() as conn:
+        cursor = _execute_query(conn, _LIST_ALL_ZONES_SQL)
+        rows = fetch_all_dicts(cursor)
     return rows
 
 
@@ -168,11 +220,8 @@ def get_system_status() -> Dict[str, Any]:
     Return the single SystemStatus row with outdoor temperature metadata.
     """
     with get_connection() as conn:
-        cursor = _execute_query(
-            conn,
-            "SELECT OutsideTemp_F, UpdatedAt FROM SystemStatus WHERE Id = 1;"
-        )
-        row = cursor.fetchone()
+        cursor = _execute_query(conn, _GET_SYSTEM_SQL)
+        row = fetch_one_dict(cursor)
     return row
 
 
@@ -198,12 +247,39 @@ def update_system_status(
     with get_connection() as conn:
         _execute_query(
             conn,
-            f"UPDATE SystemStatus SET {', '.join(assignments)} WHERE Id = 1;",
+            _update_sql("SystemStatus", tuple(assignments), "Id = 1"),
             tuple(params)
         )
         conn.commit()
 
 
+# Hot-path INSERTs kept as module constants so the connection's statement
+# cache always sees the identical SQL text and reuses the prepared statement.
+_INSERT_EVENT_SQL = """
+    INSERT INTO EventLog (
+        Timestamp,
+        Source,
+        Event,
+        ZoneRoomTemp_F,
+        PipeTemp_F,
+        OutsideTemp_F,
+        DurationSeconds
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
+_INSERT_SAMPLE_SQL = """
+    INSERT INTO TemperatureSamples (
+        Timestamp,
+        ZoneName,
+        RoomTemp_F,
+        PipeTemp_F,
+        OutsideTemp_F
+    )
+    VALUES (?, ?, ?, ?, ?);
+"""
+
+
 def record_event(
     *,
     source: str,
@@ -222,18 +298,7 @@ def record_event(
     with get_connection() as conn:
         _execute_query(
             conn,
-            """
-            INSERT INTO EventLog (
-                Timestamp,
-                Source,
-                Event,
-                ZoneRoomTemp_F,
-                PipeTemp_F,
-                OutsideTemp_F,
-                DurationSeconds
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?);
-            """,
+            _INSERT_EVENT_SQL,
             (
                 (timestamp or datetime.utcnow()).isoformat(),
                 source,
@@ -261,16 +326,7 @@ def record_temperature_sample(
     with get_connection() as conn:
         _execute_query(
             conn,
-            """
-            INSERT INTO TemperatureSamples (
-                Timestamp,
-                ZoneName,
-                RoomTemp_F,
-                PipeTemp_F,
-                OutsideTemp_F
-            )
-            VALUES (?, ?, ?, ?, ?);
-            """,
+            _INSERT_SAMPLE_SQL,
             (
                 (timestamp or datetime.utcnow()).isoformat(),
                 zone_name,
@@ -282,6 +338,48 @@ def record_temperature_sample(
         conn.commit()
 
 
+def record_temperature_samples(
+    samples: Iterable[Sequence[Any]],
+    *,
+    timestamp: Optional[datetime] = None,
+) -> None:
+    """
+    Persist several temperature snapshots taken at the same moment in one
+    transaction. Each sample is (zone_name, room_temp_f, pipe_temp_f, outside_temp_f).
+    """
+    stamp = (timestamp or datetime.utcnow()).isoformat()
+    with get_connection() as conn:
+        conn.executemany(
+            _INSERT_SAMPLE_SQL,
+            [(stamp, zone_name, room, pipe, outside) for zone_name, room, pipe, outside in samples],
+        )
+        conn.commit()
+
+
+def record_sample_readings(readings: Iterable[Sequence[Any]]) -> None:
+    """
+    Persist a batch of periodic readings in one transaction: a SAMPLE event
+    plus a TemperatureSamples row for each. Each reading is
+    (timestamp, zone_name, room_temp_f, pipe_temp_f, outside_temp_f).
+    """
+    rows = [
+        (stamp.isoformat(), zone_name, room, pipe, outside)
+        for stamp, zone_name, room, pipe, outside in readings
+    ]
+    if not rows:
+        return
+    with get_connection() as conn:
+        conn.executemany(
+            _INSERT_EVENT_SQL,
+            [
+                (stamp, zone_name, "SAMPLE", room, pipe, outside, None)
+                for stamp, zone_name, room, pipe, outside in rows
+            ],
+        )
+        conn.executemany(_INSERT_SAMPLE_SQL, rows)
+        conn.commit()
+
+
 def fetch_events(
     *,
     source: Optional[str] = None,
@@ -314,8 +412,13 @@ def fetch_events(
 
     where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
 
+    # EventDate/EventTime are sliced out of the ISO timestamp here rather than
+    # per row in Python; the text form is the same on SQLite and PostgreSQL.
     query = f"""
-        SELECT *
+        SELECT
+            *,
+            substr(CAST(Timestamp AS TEXT), 1, 10) AS EventDate,
+            substr(CAST(Timestamp AS TEXT), 12, 8) AS EventTime
         FROM EventLog
         {where_clause}
         ORDER BY Timestamp DESC
@@ -325,7 +428,7 @@ def fetch_events(
 
     with get_connection() as conn:
         cursor = _execute_query(conn, query, params)
-        rows = cursor.fetchall()
+        rows = fetch_all_dicts(cursor)
 
     return rows
 
@@ -354,32 +457,113 @@ def list_zone_schedule(zone_name: str) -> List[Dict[str, Any]]:
             """,
             (zone_name,)
         )
-        rows = cursor.fetchall()
+        rows = fetch_all_dicts(cursor)
 
     # Convert PostgreSQL row format for Pydantic model compatibility
     return rows
 
 
+def find_zone_schedule(zone_name: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Like list_zone_schedule, but returns None when the zone itself does not
+    exist. The zone row is LEFT JOINed so the check costs no extra query.
+    """
+    with get_connection() as conn:
+        cursor = _execute_query(
+            conn,
+            """
+            SELECT
+                s.Id AS Id,
+                s.ZoneName AS ZoneName,
+                s.DayOfWeek AS DayOfWeek,
+                s.StartTime AS StartTime,
+                s.EndTime AS EndTime,
+                s.Setpoint_F AS Setpoint_F,
+                s.Enabled AS Enabled,
+                s.CreatedAt AS CreatedAt,
+                s.UpdatedAt AS UpdatedAt
+            FROM ZoneStatus z
+            LEFT JOIN ZoneSchedules s ON s.ZoneName = z.ZoneName
+            WHERE z.ZoneName = ?
+            ORDER BY s.DayOfWeek ASC, s.StartTime ASC;
+            """,
+            (zone_name,),
+        )
+        rows = fetch_all_dicts(cursor)
+    if not rows:
+        return None
+    # A zone without entries comes back as one row of NULL schedule columns.
+    return [row for row in rows if row["Id"] is not None]
+
+
+def list_schedules_for_zones(zone_names: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Return schedule entries for several zones at once, keyed by zone name and
+    ordered by day/time like list_zone_schedule. Zones without entries map to
+    an empty list.
+    """
+    names = tuple(zone_names)
+    schedules: Dict[str, List[Dict[str, Any]]] = {name: [] for name in names}
+    if not names:
+        return schedules
+    placeholders = ",".join("?" for _ in names)
+    with get_connection() as conn:
+        cursor = _execute_query(
+            conn,
+            f"""
+            SELECT
+                Id,
+                ZoneName,
+                DayOfWeek,
+                StartTime,
+                EndTime,
+                Setpoint_F,
+                Enabled,
+                CreatedAt,
+                UpdatedAt
+            FROM ZoneSchedules
+            WHERE ZoneName IN ({placeholders})
+            ORDER BY ZoneName ASC, DayOfWeek ASC, StartTime ASC;
+            """,
+            names,
+        )
+        rows = fetch_all_dicts(cursor)
+    for row in rows:
+        schedules[row["ZoneName"]].append(row)
+    return schedules
+
+
+def _schedule_rows(
+    entries: Sequence[Dict[str, Any]], prefix: Tuple[Any, ...] = ()
+) -> List[Tuple[Any, ...]]:
+    """
+    Build executemany rows for schedule entries in one pass:
+    prefix + (DayOfWeek, StartTime, EndTime, Setpoint_F, Enabled).
+    """
+    return [
+        (
+            *prefix,
+            entry["DayOfWeek"],
+            entry["StartTime"],
+            entry["EndTime"],
+            entry["Setpoint_F"],
+            1 if entry.get("Enabled", True) else 0,
+        )
+        for entry in entries
+    ]
+
+
 def replace_zone_schedule(
     zone_name: str, entries: Sequence[Dict[str, Any]]
 ) -> None:
     """
     Replace the stored schedule for a zone with the provided entries.
     """
-    normalized_entries = [
-        {
-            "DayOfWeek": entry["DayOfWeek"],
-            "StartTime": entry["StartTime"],
-            "EndTime": entry["EndTime"],
-            "Setpoint_F": entry["Setpoint_F"],
-            "Enabled": 1 if entry.get("Enabled", True) else 0,
-        }
-        for entry in entries
-    ]
+    rows = _schedule_rows(entries, (zone_name,))
 
     with get_connection() as conn:
         _execute_query(conn, "DELETE FROM ZoneSchedules WHERE ZoneName = ?;", (zone_name,))
-        if normalized_entries:
+        if rows:
             cursor = conn.cursor()
             query = """
                 INSERT INTO ZoneSchedules (
@@ -392,19 +576,116 @@ def replace_zone_schedule(
                 )
                 VALUES (?, ?, ?, ?, ?, ?);
                 """
+            cursor.executemany(query, rows)
+        conn.commit()
+
 
-            data = [
-                (
-                    zone_name,
-                    entry["DayOfWeek"],
-                    entry["StartTime"],
-                    entry["EndTime"],
-                    entry["Setpoint_F"],
-                    entry["Enabled"],
+def apply_uniform_schedule(
+    zone_names: Sequence[str],
+    entries: Sequence[Dict[str, Any]],
+    *,
+    setpoint_f: float,
+    updated_at: datetime,
+) -> None:
+    """
+    Give several zones the same schedule and put them in AUTO at the given
+    setpoint, in one transaction (used by the away/home modes).
+    """
+    names = tuple(zone_names)
+    if not names:
+        return
+    placeholders = ",".join("?" for _ in names)
+    rows = [row for zone_name in names for row in _schedule_rows(entries, (zone_name,))]
+
+    with get_connection() as conn:
+        _execute_query(
+            conn, f"DELETE FROM ZoneSchedules WHERE ZoneName IN ({placeholders});", names
+        )
+        if rows:
+            conn.executemany(
+                """
+                INSERT INTO ZoneSchedules (
+                    ZoneName,
+                    DayOfWeek,
+                    StartTime,
+                    EndTime,
+                    Setpoint_F,
+                    Enabled
                 )
-                for entry in normalized_entries
-            ]
-            cursor.executemany(query, data)
+                VALUES (?, ?, ?, ?, ?, ?);
+                """,
+                rows,
+            )
+        _execute_query(
+            conn,
+            f"""
+            UPDATE ZoneStatus
+            SET TargetSetpoint_F = ?, ControlMode = 'AUTO', UpdatedAt = ?
+            WHERE ZoneName IN ({placeholders});
+            """,
+            (setpoint_f, updated_at.isoformat(), *names),
+        )
+        conn.commit()
+
+
+def list_comfort_backups() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Return the schedules saved by away/home mode, keyed by zone name.
+    """
+    with get_connection() as conn:
+        cursor = _execute_query(conn, "SELECT ZoneName, Entries FROM ComfortScheduleBackups;")
+        rows = fetch_all_dicts(cursor)
+    return {row["ZoneName"]: json.loads(row["Entries"]) for row in rows}
+
+
+def save_comfort_backups(backups: Dict[str, Sequence[Dict[str, Any]]]) -> None:
+    """
+    Save the schedules away/home mode is about to overwrite. A zone that is
+    already backed up keeps its original entries.
+    """
+    rows = [
+        (
+            zone_name,
+            json.dumps(
+                [
+                    {
+                        "DayOfWeek": day,
+                        "StartTime": start,
+                        "EndTime": end,
+                        "Setpoint_F": setpoint,
+                        "Enabled": enabled,
+                    }
+                    for day, start, end, setpoint, enabled in _schedule_rows(entries)
+                ]
+            ),
+        )
+        for zone_name, entries in backups.items()
+    ]
+    if not rows:
+        return
+    with get_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO ComfortScheduleBackups (ZoneName, Entries)
+            VALUES (?, ?)
+            ON CONFLICT (ZoneName) DO NOTHING;
+            """,
+            rows,
+        )
+        conn.commit()
+
+
+def delete_comfort_backups(zone_names: Iterable[str]) -> None:
+    names = tuple(zone_names)
+    if not names:
+        return
+    placeholders = ",".join("?" for _ in names)
+    with get_connection() as conn:
+        _execute_query(
+            conn,
+            f"DELETE FROM ComfortScheduleBackups WHERE ZoneName IN ({placeholders});",
+            names,
+        )
         conn.commit()
 
 
@@ -430,7 +711,7 @@ def list_all_schedules() -> List[Dict[str, Any]]:
             ORDER BY ZoneName ASC, DayOfWeek ASC, StartTime ASC;
             """
         )
-        rows = cursor.fetchall()
+        rows = fetch_all_dicts(cursor)
     return rows
 
 
@@ -452,25 +733,16 @@ def list_global_schedule() -> List[Dict[str, Any]]:
             ORDER BY DayOfWeek ASC, StartTime ASC;
             """
         )
-        rows = cursor.fetchall()
+        rows = fetch_all_dicts(cursor)
     return rows
 
 
 def replace_global_schedule(entries: Sequence[Dict[str, Any]]) -> None:
-    normalized_entries = [
-        {
-            "DayOfWeek": entry["DayOfWeek"],
-            "StartTime": entry["StartTime"],
-            "EndTime": entry["EndTime"],
-            "Setpoint_F": entry["Setpoint_F"],
-            "Enabled": 1 if entry.get("Enabled", True) else 0,
-        }
-        for entry in entries
-    ]
+    rows = _schedule_rows(entries)
 
     with get_connection() as conn:
         _execute_query(conn, "DELETE FROM GlobalSchedule;")
-        if normalized_entries:
+        if rows:
             conn.executemany(
                 """
                 INSERT INTO GlobalSchedule (
@@ -482,16 +754,7 @@ def replace_global_schedule(entries: Sequence[Dict[str, Any]]) -> None:
                 )
                 VALUES (?, ?, ?, ?, ?);
                 """,
-                [
-                    (
-                        entry["DayOfWeek"],
-                        entry["StartTime"],
-                        entry["EndTime"],
-                        entry["Setpoint_F"],
-                        entry["Enabled"],
-                    )
-                    for entry in normalized_entries
-                ],
+                rows,
             )
         conn.commit()
 
@@ -506,49 +769,65 @@ def list_presets() -> List[Dict[str, Any]]:
             ORDER BY UPPER(Name) ASC;
             """
         )
-        rows = cursor.fetchall()
+        rows = fetch_all_dicts(cursor)
 
     return rows
 
 
 def get_preset_with_entries(preset_id: int) -> Optional[Dict[str, Any]]:
+    # One LEFT JOIN returns the preset columns on every entry row (or a single
+    # row with NULL entry columns when the preset has no entries).
     with get_connection() as conn:
-        cursor = _execute_query(
-            conn,
-            """
-            SELECT Id, Name, Description, CreatedAt, UpdatedAt
-            FROM SchedulePresets
-            WHERE Id = ?;
-            """,
-            (preset_id,),
-        )
-        preset_row = cursor.fetchone()
-        if not preset_row:
-            return None
-
-        # Convert Row to dict
-        preset = dict(preset_row)
-
         cursor = _execute_query(
             conn,
             """
             SELECT
-                Id,
-                DayOfWeek,
-                StartTime,
-                EndTime,
-                Setpoint_F,
-                Enabled,
-                CreatedAt,
-                UpdatedAt
-            FROM SchedulePresetEntries
-            WHERE PresetId = ?
-            ORDER BY DayOfWeek ASC, StartTime ASC;
+                p.Id,
+                p.Name,
+                p.Description,
+                p.CreatedAt,
+                p.UpdatedAt,
+                e.Id AS EntryId,
+                e.DayOfWeek,
+                e.StartTime,
+                e.EndTime,
+                e.Setpoint_F,
+                e.Enabled,
+                e.CreatedAt AS EntryCreatedAt,
+                e.UpdatedAt AS EntryUpdatedAt
+            FROM SchedulePresets AS p
+            LEFT JOIN SchedulePresetEntries AS e ON e.PresetId = p.Id
+            WHERE p.Id = ?
+            ORDER BY e.DayOfWeek ASC, e.StartTime ASC;
             """,
             (preset_id,),
         )
-        entries = cursor.fetchall()
-        preset["Entries"] = [dict(entry) for entry in entries]
+        rows = fetch_all_dicts(cursor)
+    if not rows:
+        return None
+
+    first = rows[0]
+    preset = {
+        "Id": first["Id"],
+        "Name": first["Name"],
+        "Description": first["Description"],
+        "CreatedAt": first["CreatedAt"],
+        "UpdatedAt": first["UpdatedAt"],
+    }
+    preset["Entries"] = [
+        {
+            "Id": row["EntryId"],
+            "DayOfWeek": row["DayOfWeek"],
+            "StartTime": row["StartTime"],
+            "EndTime": row["EndTime"],
+            "Setpoint_F": row["Setpoint_F"],
+            "Enabled": row["Enabled"],
+            "CreatedAt": row["EntryCreatedAt"],
+            "UpdatedAt": row["EntryUpdatedAt"],
+        }
+        for row in rows
+        if row["EntryId"] is not None
+    ]
     return preset
 
 
@@ -561,16 +840,7 @@ def create_preset(
     # Entries are already normalized by zone_service._normalize_request_entries
     # with PascalCase keys. Prepare them for database insertion.
     try:
-        normalized_entries = [
-            (
-                entry["DayOfWeek"],
-                entry["StartTime"],
-                entry["EndTime"],
-                entry["Setpoint_F"],
-                1 if entry.get("Enabled", True) else 0,
-            )
-            for entry in entries
-        ]
+        rows = _schedule_rows(entries)
     except KeyError as e:
         raise ValueError(f"Missing required field in preset entry: {e}")
 
@@ -585,7 +855,7 @@ def create_preset(
             raise ValueError("A preset with that name already exists") from exc
 
         preset_id = cursor.lastrowid
-        if normalized_entries:
+        if rows:
             conn.executemany(
                 """
                 INSERT INTO SchedulePresetEntries (
@@ -598,7 +868,7 @@ def create_preset(
                 )
                 VALUES (?, ?, ?, ?, ?, ?);
                 """,
-                [(preset_id, *entry) for entry in normalized_entries],
+                [(preset_id, *row) for row in rows],
             )
         conn.commit()
 
@@ -630,7 +900,7 @@ def update_preset_metadata(
         try:
             _execute_query(
                 conn,
-                f"UPDATE SchedulePresets SET {', '.join(assignments)} WHERE Id = ?;",
+                _update_sql("SchedulePresets", tuple(assignments), "Id = ?"),
                 params,
             )
             conn.commit()
@@ -641,20 +911,11 @@ def update_preset_metadata(
 def replace_preset_entries(
     preset_id: int, entries: Sequence[Dict[str, Any]]
 ) -> None:
-    normalized_entries = [
-        {
-            "DayOfWeek": entry["DayOfWeek"],
-            "StartTime": entry["StartTime"],
-            "EndTime": entry["EndTime"],
-            "Setpoint_F": entry["Setpoint_F"],
-            "Enabled": 1 if entry.get("Enabled", True) else 0,
-        }
-        for entry in entries
-    ]
+    rows = _schedule_rows(entries, (preset_id,))
 
     with get_connection() as conn:
         _execute_query(conn, "DELETE FROM SchedulePresetEntries WHERE PresetId = ?;", (preset_id,))
-        if normalized_entries:
+        if rows:
             conn.executemany(
                 """
                 INSERT INTO SchedulePresetEntries (
@@ -667,17 +928,7 @@ def replace_preset_entries(
                 )
                 VALUES (?, ?, ?, ?, ?, ?);
                 """,
-                [
-                    (
-                        preset_id,
-                        entry["DayOfWeek"],
-                        entry["StartTime"],
-                        entry["EndTime"],
-                        entry["Setpoint_F"],
-                        entry["Enabled"],
-                    )
-                    for entry in normalized_entries
-                ],
+                rows,
             )
         _execute_query(
             conn,
@@ -0,0 +1,98 @@
+-- SQLite schema, executed as a single script by init_db().
+-- Indexes live in indexes.sql.
+-- Bump SCHEMA_VERSION in database.py after editing this file.
+
+CREATE TABLE IF NOT EXISTS ZoneStatus (
+    ZoneName TEXT PRIMARY KEY,
+    CurrentState TEXT NOT NULL CHECK (CurrentState IN ('ON', 'OFF')),
+    ZoneRoomTemp_F REAL,
+    PipeTemp_F REAL,
+    TargetSetpoint_F REAL,
+    ControlMode TEXT NOT NULL CHECK (ControlMode IN ('AUTO', 'MANUAL', 'THERMOSTAT')),
+    SetpointOverrideAt TEXT,
+    SetpointOverrideMode TEXT CHECK (SetpointOverrideMode IN ('boundary', 'permanent', 'timed')),
+    SetpointOverrideUntil TEXT,
+    SortOrder INTEGER,
+    UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS SystemStatus (
+    Id INTEGER PRIMARY KEY CHECK (Id = 1),
+    OutsideTemp_F REAL,
+    UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS EventLog (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    Timestamp TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    Source TEXT NOT NULL,
+    Event TEXT NOT NULL,
+    ZoneRoomTemp_F REAL,
+    PipeTemp_F REAL,
+    OutsideTemp_F REAL,
+    DurationSeconds REAL
+);
+
+CREATE TABLE IF NOT EXISTS TemperatureSamples (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    Timestamp TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    ZoneName TEXT NOT NULL,
+    RoomTemp_F REAL,
+    PipeTemp_F REAL,
+    OutsideTemp_F REAL
+);
+
+CREATE TABLE IF NOT EXISTS ZoneSchedules (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ZoneName TEXT NOT NULL,
+    DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
+    StartTime TEXT NOT NULL,
+    EndTime TEXT NOT NULL,
+    Setpoint_F REAL NOT NULL,
+    Enabled INTEGER NOT NULL DEFAULT 1,
+    CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (ZoneName, DayOfWeek, StartTime)
+);
+
+CREATE TABLE IF NOT EXISTS GlobalSchedule (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
+    StartTime TEXT NOT NULL,
+    EndTime TEXT NOT NULL,
+    Setpoint_F REAL NOT NULL,
+    Enabled INTEGER NOT NULL DEFAULT 1,
+    CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (DayOfWeek, StartTime)
+);
+
+CREATE TABLE IF NOT EXISTS SchedulePresets (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    Name TEXT NOT NULL UNIQUE,
+    Description TEXT,
+    CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS SchedulePresetEntries (
+    Id INTEGER PRIMARY KEY AUTOINCREMENT,
+    PresetId INTEGER NOT NULL,
+    DayOfWeek INTEGER NOT NULL CHECK (DayOfWeek BETWEEN 0 AND 6),
+    StartTime TEXT NOT NULL,
+    EndTime TEXT NOT NULL,
+    Setpoint_F REAL NOT NULL,
+    Enabled INTEGER NOT NULL DEFAULT 1,
+    CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UpdatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (PresetId, DayOfWeek, StartTime),
+    FOREIGN KEY (PresetId) REFERENCES SchedulePresets(Id) ON DELETE CASCADE
+);
+
+-- Zone schedules saved when away/home mode overwrites them, restored (and
+-- deleted) by resume-schedule. Entries is a JSON list of schedule entries.
+CREATE TABLE IF NOT EXISTS ComfortScheduleBackups (
+    ZoneName TEXT PRIMARY KEY,
+    Entries TEXT NOT NULL,
+    CreatedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID;
@@ -5,27 +5,26 @@ Service layer for event logging.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import logging
+import threading
 import time
 
+from pydantic import TypeAdapter
+
 from .. import repositories
 from ..config import settings
 from ..schemas import EventLogModel
 
+# Validates a whole result list in one pydantic-core call.
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventLogModel])
 
-def _split_timestamp(value: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
-    if not value:
-        return None, None
-    normalized = value.replace(" ", "T")
-    parts = normalized.split("T")
-    date_part = parts[0] if parts else None
-    time_part = parts[1] if len(parts) > 1 else None
-    if time_part:
-        time_part = time_part.replace("Z", "")
-        if "." in time_part:
-            time_part = time_part.split(".")[0]
-    return date_part, time_part
+# Bounds on the polled /api/events results kept in memory: distinct queries,
+# total rows across them, and how long one may be served. The TTL covers rows
+# written by other processes, which never reach _invalidate_events.
+_EVENTS_CACHE_SIZE = 64
+_EVENTS_CACHE_MAX_ROWS = 4000
+_EVENTS_CACHE_TTL_SECONDS = 5.0
 
 
 class EventService:
@@ -34,6 +33,32 @@ class EventService:
     work with strongly-typed Pydantic models.
     """
 
+    def __init__(self) -> None:
+        # Dashboards poll /api/events with the same arguments, so those results
+        # are kept briefly and dropped early by this process's own writes. The
+        # generation counter stops a query that raced a write from storing a
+        # stale result.
+        self._events_cache: Dict[Tuple[Any, ...], Tuple[float, List[EventLogModel]]] = {}
+        self._events_cached_rows = 0
+        self._events_generation = 0
+        self._events_lock = threading.Lock()
+
+    def _invalidate_events(self, *, samples_only: bool = False) -> None:
+        with self._events_lock:
+            self._events_generation += 1
+            if samples_only:
+                # SAMPLE rows are invisible to queries that exclude them.
+                for key in [key for key in self._events_cache if key[-1]]:
+                    self._drop_cached(key)
+            else:
+                self._events_cache.clear()
+                self._events_cached_rows = 0
+
+    def _drop_cached(self, key: Tuple[Any, ...]) -> None:
+        # Caller holds _events_lock.
+        _, events = self._events_cache.pop(key)
+        self._events_cached_rows -= len(events)
+
     def log_event(
         self,
         *,
@@ -57,6 +82,15 @@ class EventService:
             duration_seconds=duration_seconds,
             timestamp=timestamp,
         )
+        self._invalidate_events()
+
+    def log_samples(self, readings: Iterable[Sequence[Any]]) -> None:
+        """
+        Record a batch of periodic temperature readings (SAMPLE events and
+        TemperatureSamples rows) with a single commit.
+        """
+        repositories.record_sample_readings(readings)
+        self._invalidate_events(samples_only=True)
 
     def list_events(
         self,
@@ -66,10 +100,26 @@ class EventService:
         until: Optional[str] = None,
         limit: int = 500,
         include_samples: bool = False,
+        cache: bool = False,
     ) -> List[EventLogModel]:
         """
         Retrieve recent events (optionally filtered) as Pydantic models.
+
+        Pass cache=True for repeatedly polled queries; the result may then be
+        up to a few seconds old.
         """
+        key = (source, since, until, limit, include_samples)
+        if cache:
+            now = time.monotonic()
+            with self._events_lock:
+                entry = self._events_cache.get(key)
+                if entry is not None and entry[0] <= now:
+                    self._drop_cached(key)
+                    entry = None
+                generation = self._events_generation
+            if entry is not None:
+                return list(entry[1])
+
         start_time = time.perf_counter()
         rows = repositories.fetch_events(
             source=source,
@@ -78,13 +128,12 @@ class EventService:
             limit=limit,
             exclude_events=None if include_samples else ["SAMPLE"],
         )
+        # EventDate/EventTime come back from the query; only the room name
+        # (from config) is added here.
+        room_map = settings.zone_room_map
         for row in rows:
-            row["RoomName"] = settings.zone_room_map.get(
-                row.get("Source", ""), row.get("Source")
-            )
-            date_part, time_part = _split_timestamp(row.get("Timestamp"))
-            row["EventDate"] = date_part
-            row["EventTime"] = time_part
+            row_source = row.get("Source")
+            row["RoomName"] = room_map.get(row_source or "", row_source)
         duration = time.perf_counter() - start_time
         logging.getLogger(__name__).info(
             "events.list source=%s limit=%s rows=%s duration=%.3fs samples=%s",
@@ -94,4 +143,17 @@ class EventService:
             duration,
             include_samples,
         )
-        return [EventLogModel.model_validate(row) for row in rows]
+        events = _EVENT_LIST_ADAPTER.validate_python(rows)
+        if cache and len(events) <= _EVENTS_CACHE_MAX_ROWS:
+            with self._events_lock:
+                if generation == self._events_generation:
+                    if key in self._events_cache:
+                        self._drop_cached(key)
+                    while self._events_cache and (
+                        len(self._events_cache) >= _EVENTS_CACHE_SIZE
+                        or self._events_cached_rows + len(events) > _EVENTS_CACHE_MAX_ROWS
+                    ):
+                        self._drop_cached(next(iter(self._events_cache)))
+                    self._events_cache[key] = (now + _EVENTS_CACHE_TTL_SECONDS, events)
+                    self._events_cached_rows += len(events)
+        return list(events)
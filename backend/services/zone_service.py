@@ -5,8 +5,9 @@ Zone orchestration logic.
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from threading import Lock
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Set
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Set
 import logging
 import time
 
@@ -15,6 +16,8 @@ try:  # Python 3.9+
 except ImportError:  # pragma: no cover - Python < 3.9
     from backports.zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # type: ignore[assignment]
 
+from pydantic import TypeAdapter
+
 from .. import repositories
 from ..config import settings
 from ..hardware import BaseHardwareController
@@ -38,26 +41,33 @@ from .event_service import EventService
 
 logger = logging.getLogger(__name__)
 
+# List results are validated in one pydantic-core call per request instead of
+# one model_validate per row.
+_ZONE_LIST_ADAPTER = TypeAdapter(List[ZoneStatusModel])
+_SCHEDULE_LIST_ADAPTER = TypeAdapter(List[ZoneScheduleEntryModel])
+_PRESET_LIST_ADAPTER = TypeAdapter(List[SchedulePresetSummaryModel])
+
+# (per-zone schedule entries, global schedule entries), loaded once for a pass
+# over several zones; see ZoneService._load_schedules.
+_ScheduleSnapshot = Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]
+
 
-def _normalize_row_keys(row: Dict[str, Any]) -> Dict[str, Any]:
+@lru_cache(maxsize=32)
+def _get_tzinfo(name: str) -> ZoneInfo:
     """
-    Normalize database row keys for consistent access.
-    SQLite preserves case, so this is mostly a pass-through.
+    Resolve a timezone name once per process. History and statistics requests
+    pass the same few names on every call; unknown names still raise.
     """
-    if not row:
-        return row
-
-    # SQLite already returns proper case, no mapping needed
-    return row
+    return ZoneInfo(name)
 
 
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     """Parse ISO or SQLite-style timestamps into datetime objects."""
     if not value:
         return None
-    normalized = value.replace(" ", "T")
+    # fromisoformat accepts either "T" or " " between date and time.
     try:
-        return datetime.fromisoformat(normalized)
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
@@ -70,6 +80,10 @@ def _split_timestamp(value: Optional[str]) -> Tuple[Optional[str], Optional[str]
         value = value.isoformat()
     # Convert to string if it's not already
     value = str(value)
+    # Fast path for the stored forms ("YYYY-MM-DD[T ]HH:MM:SS[.ffffff...]"):
+    # slice the parts directly instead of splitting.
+    if value[10:11] in ("T", " ") and value[19:20] in ("", "."):
+        return value[:10], value[11:19]
     normalized = value.replace(" ", "T")
     parts = normalized.split("T")
     date_part = parts[0] if parts else None
@@ -99,8 +113,6 @@ class ZoneService:
         self.events = event_service
         self._last_sample: Dict[str, datetime] = {}
         self._sample_interval = timedelta(minutes=1)
-        self._schedule_backup: Dict[str, List[Dict[str, Any]]] = {}
-        self._comfort_override: Set[str] = set()
         self._history_cache: Dict[str, Tuple[float, List[EventLogModel]]] = {}
         self._history_cache_lock = Lock()
         self._history_cache_ttl = 300.0  # seconds for generic windows
@@ -109,11 +121,20 @@ class ZoneService:
         self._history_batch_cache: Dict[str, Tuple[float, Dict[str, List[EventLogModel]]]] = {}
         self._history_batch_lock = Lock()
         self._history_batch_ttl = 180.0
+        self._preload_lock = Lock()
+        # (zone names, choices) for the page zone pickers; see get_selectable_zones.
+        self._selectable_zones: Optional[Tuple[Tuple[str, ...], Tuple[Dict[str, str], ...]]] = None
 
     def preload_history_cache(self, tz: Optional[str] = None) -> None:
+        # Single flight: a concurrent caller waits for the running warm-up,
+        # after which its own pass over the windows is all cache hits.
+        with self._preload_lock:
+            self._warm_history_cache(tz)
+
+    def _warm_history_cache(self, tz: Optional[str]) -> None:
         timezone_name = tz or settings.time_zone
         try:
-            tzinfo = ZoneInfo(timezone_name)
+            tzinfo = _get_tzinfo(timezone_name)
         except Exception:
             return
         zone_names = [
@@ -191,10 +212,10 @@ class ZoneService:
             if include_boiler
             else repositories.list_zone_status()
         )
+        schedules = self._load_schedules(rows)
         processed: List[Dict[str, Any]] = []
         for row in rows:
-            normalized = _normalize_row_keys(row)
-            processed.append(self._decorate_row(self._sync_auto_setpoint(normalized)))
+            processed.append(self._decorate_row(self._sync_auto_setpoint(row, schedules)))
         duration = time.perf_counter() - start_time
         logger.info(
             "zones.list include_boiler=%s rows=%s duration=%.3fs",
@@ -202,7 +223,27 @@ class ZoneService:
             len(processed),
             duration,
         )
-        return [ZoneStatusModel.model_validate(row) for row in processed]
+        return _ZONE_LIST_ADAPTER.validate_python(processed)
+
+    def get_selectable_zones(
+        self, zones: Iterable[ZoneStatusModel]
+    ) -> Tuple[Dict[str, str], ...]:
+        """
+        Zone/room choices for the page pickers, excluding the boiler. Room names
+        come from static config, so the choices only change when the set of
+        zones does; the same read-only tuple is shared across requests.
+        """
+        zone_list = [zone for zone in zones if zone.zone_name != "Boiler"]
+        names = tuple(zone.zone_name for zone in zone_list)
+        cached = self._selectable_zones
+        if cached is not None and cached[0] == names:
+            return cached[1]
+        choices = tuple(
+            {"zone": zone.zone_name, "room": zone.room_name or zone.zone_name}
+            for zone in zone_list
+        )
+        self._selectable_zones = (names, choices)
+        return choices
 
     def get_zone(self, zone_name: str, sync_setpoint: bool = False) -> ZoneStatusModel:
         """
@@ -212,12 +253,9 @@ class ZoneService:
         row = repositories.get_zone_status(zone_name)
         if not row:
             raise KeyError(f"Zone {zone_name} not found")
-        normalized = _normalize_row_keys(row)
         if sync_setpoint:
-            normalized = self._decorate_row(self._sync_auto_setpoint(normalized))
-        else:
-            normalized = self._decorate_row(normalized)
-        return ZoneStatusModel.model_validate(normalized)
+            row = self._sync_auto_setpoint(row)
+        return ZoneStatusModel.model_validate(self._decorate_row(row))
 
     def update_zone(self, zone_name: str, payload: ZoneUpdateRequest) -> ZoneStatusModel:
         """
@@ -228,14 +266,19 @@ class ZoneService:
         - 'permanent': override indefinitely
         - 'timed': override until specific datetime
         """
+        current = repositories.get_zone_status(zone_name)
+        # The setpoint and mode branches only collect the final column values;
+        # a combined change is then written with a single UPDATE.
+        changes: Dict[str, Any] = {}
+        clear_override = False
+
         # Check if this is a setpoint change in AUTO mode
         if payload.target_setpoint_f is not None:
-            current = repositories.get_zone_status(zone_name)
             control_mode = current.get("ControlMode") if current else None
+            changes["target_setpoint_f"] = payload.target_setpoint_f
 
             if current and control_mode == "AUTO":
                 # Mark as manual override with timestamp and mode
-                from datetime import datetime
                 override_mode = getattr(payload, 'override_mode', None) or "permanent"
                 override_until = None
 
@@ -248,72 +291,43 @@ class ZoneService:
                         override_mode = "boundary"  # Fallback to boundary mode
 
                 logger.info(f"Setpoint change in AUTO mode for {zone_name}: {payload.target_setpoint_f}°F with {override_mode} override")
-                repositories.update_zone_status(
-                    zone_name,
-                    target_setpoint_f=payload.target_setpoint_f,
-                    setpoint_override_at=datetime.utcnow(),
-                    setpoint_override_mode=override_mode,
-                    setpoint_override_until=override_until,
-                )
+                changes["setpoint_override_at"] = datetime.utcnow()
+                changes["setpoint_override_mode"] = override_mode
+                changes["setpoint_override_until"] = override_until
             else:
                 logger.info(f"Setpoint change for {zone_name}: {payload.target_setpoint_f}°F (mode: {current.get('ControlMode') if current else 'unknown'})")
-                repositories.update_zone_status(
-                    zone_name,
-                    target_setpoint_f=payload.target_setpoint_f,
-                )
 
         if payload.control_mode is not None:
-            current = repositories.get_zone_status(zone_name)
+            new_mode = payload.control_mode
+            changes["control_mode"] = new_mode
             if current:
                 # Handle mode transition boundary conditions
                 current_mode = current.get("ControlMode")
-                new_mode = payload.control_mode
 
                 if current_mode == "AUTO" and new_mode in ["MANUAL", "ON", "OFF"]:
                     # Transitioning from AUTO to manual mode
-                    # Preserve the current effective setpoint and clear override metadata
-                    current_setpoint = current.get("TargetSetpoint_F")
-                    if current_setpoint is not None:
-                        repositories.update_zone_status(
-                            zone_name,
-                            control_mode=new_mode,
-                            target_setpoint_f=current_setpoint,
-                            clear_override=True,
-                        )
-                    else:
-                        repositories.update_zone_status(
-                            zone_name,
-                            control_mode=new_mode,
-                            clear_override=True,
-                        )
+                    # Keep the effective setpoint (including one set above) and
+                    # clear override metadata
+                    clear_override = True
                 elif current_mode in ["MANUAL", "ON", "OFF"] and new_mode == "AUTO":
                     # Transitioning from manual to AUTO mode
                     # Set to scheduled setpoint and clear any manual overrides
                     scheduled_setpoint = self._resolve_scheduled_setpoint(zone_name)
                     if scheduled_setpoint is not None:
-                        repositories.update_zone_status(
-                            zone_name,
-                            control_mode=new_mode,
-                            target_setpoint_f=scheduled_setpoint,
-                            clear_override=True,
-                        )
-                    else:
-                        repositories.update_zone_status(
-                            zone_name,
-                            control_mode=new_mode,
-                            clear_override=True,
-                        )
-                else:
-                    # No special handling needed for other transitions
-                    repositories.update_zone_status(
-                        zone_name,
-                        control_mode=new_mode,
-                    )
-            else:
-                repositories.update_zone_status(
-                    zone_name,
-                    control_mode=payload.control_mode,
-                )
+                        changes["target_setpoint_f"] = scheduled_setpoint
+                    clear_override = True
+
+        if clear_override:
+            for key in (
+                "setpoint_override_at",
+                "setpoint_override_mode",
+                "setpoint_override_until",
+            ):
+                changes.pop(key, None)
+        if changes:
+            repositories.update_zone_status(
+                zone_name, clear_override=clear_override, **changes
+            )
 
         return self.get_zone(zone_name)
 
@@ -329,6 +343,8 @@ class ZoneService:
             raise KeyError(f"Zone {zone_name} not found")
         previous_state = zone_row.get("CurrentState")
         previous_updated = _parse_timestamp(zone_row.get("UpdatedAt"))
+        system_status = repositories.get_system_status()
+        outside_temp = system_status.get("OutsideTemp_F") if system_status else None
 
         command = payload.command
         if command == "FORCE_ON":
@@ -364,11 +380,6 @@ class ZoneService:
             )
             updated_zone = self.get_zone(zone_name)
 
-            system_status = repositories.get_system_status()
-            outside_temp = (
-                system_status.get("OutsideTemp_F") if system_status else None
-            )
-
             setpoint = updated_zone.target_setpoint_f
             room_temp = updated_zone.zone_room_temp_f
             desired_state: Optional[str] = None
@@ -398,8 +409,6 @@ class ZoneService:
             # Release control so external thermostat wiring can drive the zone.
             logger.info(f"THERMOSTAT command for {zone_name}: setting ControlMode=THERMOSTAT in database")
             self.hardware.set_zone_state(zone_name, False)
-            system_status = repositories.get_system_status()
-            outside_temp = system_status.get("OutsideTemp_F") if system_status else None
             duration_seconds = None
             if previous_state == "ON" and previous_updated:
                 duration_seconds = (timestamp - previous_updated).total_seconds()
@@ -437,9 +446,7 @@ class ZoneService:
                 event="ON" if command == "FORCE_ON" else "OFF",
                 zone_room_temp_f=updated_row.zone_room_temp_f,
                 pipe_temp_f=updated_row.pipe_temp_f,
-                outside_temp_f=(
-                    repositories.get_system_status().get("OutsideTemp_F")
-                ),
+                outside_temp_f=outside_temp,
                 duration_seconds=duration_seconds,
                 timestamp=timestamp,
             )
@@ -449,12 +456,12 @@ class ZoneService:
     def get_zone_schedule(
         self, zone_name: str, include_global: bool = False
     ) -> List[ZoneScheduleEntryModel]:
-        if not repositories.get_zone_status(zone_name):
+        rows = repositories.find_zone_schedule(zone_name)
+        if rows is None:
             raise KeyError(f"Zone {zone_name} not found")
-        rows = repositories.list_zone_schedule(zone_name)
         if include_global and not rows:
             rows = repositories.list_global_schedule()
-        return [ZoneScheduleEntryModel.model_validate(row) for row in rows]
+        return _SCHEDULE_LIST_ADAPTER.validate_python(rows)
 
     def update_zone_schedule(
         self, zone_name: str, payload: ZoneScheduleUpdateRequest
@@ -488,14 +495,21 @@ class ZoneService:
             for entry in entries
         ]
 
-        updated: List[str] = []
-        seen_targets: Set[str] = set()
+        # De-duplicate the targets and check them all with one query before
+        # any schedule is replaced.
+        targets: List[str] = []
+        seen_targets: Set[str] = {zone_name}
         for target in payload.target_zones:
-            if target == zone_name or target in seen_targets:
-                continue
-            seen_targets.add(target)
-            if not repositories.get_zone_status(target):
+            if target not in seen_targets:
+                seen_targets.add(target)
+                targets.append(target)
+        existing = repositories.get_zone_names_in(targets)
+        for target in targets:
+            if target not in existing:
                 raise KeyError(f"Zone {target} not found")
+
+        updated: List[str] = []
+        for target in targets:
             repositories.replace_zone_schedule(target, normalized)
             updated.append(target)
         if updated:
@@ -523,34 +537,36 @@ class ZoneService:
     def apply_uniform_setpoint(self, setpoint_f: float) -> List[ZoneStatusModel]:
         timestamp = datetime.utcnow()
         changed: List[str] = []
+        existing = repositories.get_zone_names_in(settings.zone_names)
         for zone_name in settings.zone_names:
             if zone_name in self._zones_without_setpoint:
                 continue
-            if not repositories.get_zone_status(zone_name):
+            if zone_name not in existing:
                 continue
-            if zone_name not in self._comfort_override:
-                original = repositories.list_zone_schedule(zone_name)
-                self._schedule_backup[zone_name] = original
-                self._comfort_override.add(zone_name)
+            changed.append(zone_name)
 
-            uniform_entries = [
-                {
-                    "DayOfWeek": day,
-                    "StartTime": "00:00",
-                    "EndTime": "00:00",
-                    "Setpoint_F": setpoint_f,
-                    "Enabled": True,
-                }
-                for day in range(7)
-            ]
-            repositories.replace_zone_schedule(zone_name, uniform_entries)
-            repositories.update_zone_status(
-                zone_name,
-                target_setpoint_f=setpoint_f,
-                control_mode="AUTO",
-                updated_at=timestamp,
+        # Back up the real schedules of zones not already in away/home mode.
+        # The backups live in the database so resume works after a restart.
+        backed_up = repositories.list_comfort_backups()
+        repositories.save_comfort_backups(
+            repositories.list_schedules_for_zones(
+                zone_name for zone_name in changed if zone_name not in backed_up
             )
-            changed.append(zone_name)
+        )
+
+        uniform_entries = [
+            {
+                "DayOfWeek": day,
+                "StartTime": "00:00",
+                "EndTime": "00:00",
+                "Setpoint_F": setpoint_f,
+                "Enabled": True,
+            }
+            for day in range(7)
+        ]
+        repositories.apply_uniform_schedule(
+            changed, uniform_entries, setpoint_f=setpoint_f, updated_at=timestamp
+        )
         if changed:
             self._refresh_auto_setpoints(changed)
         return self.list_zones()
@@ -558,10 +574,13 @@ class ZoneService:
     def resume_schedule_mode(self) -> List[ZoneStatusModel]:
         timestamp = datetime.utcnow()
         auto_targets: List[str] = []
+        restored: List[str] = []
+        existing = repositories.get_zone_names_in(settings.zone_names)
+        backups = repositories.list_comfort_backups()
         for zone_name in settings.zone_names:
             if zone_name in self._zones_without_setpoint:
                 continue
-            if not repositories.get_zone_status(zone_name):
+            if zone_name not in existing:
                 continue
             repositories.update_zone_status(
                 zone_name,
@@ -569,19 +588,18 @@ class ZoneService:
                 target_setpoint_f=None,
                 updated_at=timestamp,
             )
-            if zone_name in self._comfort_override:
-                original = self._schedule_backup.get(zone_name, [])
-                repositories.replace_zone_schedule(zone_name, original)
-                self._comfort_override.discard(zone_name)
-                self._schedule_backup.pop(zone_name, None)
+            if zone_name in backups:
+                repositories.replace_zone_schedule(zone_name, backups[zone_name])
+                restored.append(zone_name)
             auto_targets.append(zone_name)
+        repositories.delete_comfort_backups(restored)
         if auto_targets:
             self._refresh_auto_setpoints(auto_targets)
         return self.list_zones()
 
     def get_global_schedule(self) -> List[ZoneScheduleEntryModel]:
         rows = repositories.list_global_schedule()
-        return [ZoneScheduleEntryModel.model_validate(row) for row in rows]
+        return _SCHEDULE_LIST_ADAPTER.validate_python(rows)
 
     def update_global_schedule(
         self, payload: GlobalScheduleUpdateRequest
@@ -593,7 +611,7 @@ class ZoneService:
 
     def list_schedule_presets(self) -> List[SchedulePresetSummaryModel]:
         rows = repositories.list_presets()
-        return [SchedulePresetSummaryModel.model_validate(row) for row in rows]
+        return _PRESET_LIST_ADAPTER.validate_python(rows)
 
     def get_schedule_preset(self, preset_id: int) -> SchedulePresetDetailModel:
         preset = repositories.get_preset_with_entries(preset_id)
@@ -663,10 +681,6 @@ class ZoneService:
         previous_row = repositories.get_zone_status(zone_name)
         if not previous_row:
             raise KeyError(f"Zone {zone_name} not found")
-        previous_row["RoomName"] = settings.zone_room_map.get(zone_name, zone_name)
-        date_part, time_part = _split_timestamp(previous_row.get("UpdatedAt"))
-        previous_row["UpdatedDate"] = date_part
-        previous_row["UpdatedTime"] = time_part
 
         timestamp = datetime.utcnow()
         duration_seconds: Optional[float] = None
@@ -717,10 +731,6 @@ class ZoneService:
         previous_row = repositories.get_zone_status("Boiler")
         if not previous_row:
             raise KeyError("Boiler row missing")
-        previous_row["RoomName"] = settings.zone_room_map.get("Boiler", "Boiler")
-        date_part, time_part = _split_timestamp(previous_row.get("UpdatedAt"))
-        previous_row["UpdatedDate"] = date_part
-        previous_row["UpdatedTime"] = time_part
 
         timestamp = datetime.utcnow()
         duration_seconds: Optional[float] = None
@@ -769,13 +779,15 @@ class ZoneService:
         self,
         row: Dict[str, Any],
         outside_temp: Optional[float],
+        schedules: Optional[_ScheduleSnapshot] = None,
+        room_temps: Optional[List[Tuple[str, float]]] = None,
     ) -> Dict[str, Any]:
         zone_name = row.get("ZoneName")
         if not zone_name:
             return self._decorate_row(row)
 
         room_temp = row.get("ZoneRoomTemp_F")
-        row = self._sync_auto_setpoint(row)
+        row = self._sync_auto_setpoint(row, schedules)
         setpoint = row.get("TargetSetpoint_F")
 
         if setpoint is None or room_temp is None:
@@ -793,7 +805,7 @@ class ZoneService:
 
         if desired_state is None:
             return self._decorate_row(
-                self._simulate_temperature(row, outside_temp)
+                self._simulate_temperature(row, outside_temp, room_temps)
             )
 
         if desired_state == "ON":
@@ -818,7 +830,7 @@ class ZoneService:
         )
 
         simulated = self._simulate_temperature(
-            updated.model_dump(by_alias=True), outside_temp
+            updated.model_dump(by_alias=True), outside_temp, room_temps
         )
         return self._decorate_row(simulated)
 
@@ -826,8 +838,13 @@ class ZoneService:
         self,
         row: Dict[str, Any],
         outside_temp: Optional[float],
+        room_temps: Optional[List[Tuple[str, float]]] = None,
     ) -> Dict[str, Any]:
-        """Adjust the stored room temperature to mimic heating/cooling."""
+        """
+        Adjust the stored room temperature to mimic heating/cooling. With
+        room_temps the plain temperature write is queued there for the caller
+        to flush in one batch.
+        """
         current_temp = row.get("ZoneRoomTemp_F")
         setpoint = row.get("TargetSetpoint_F")
         if current_temp is None or setpoint is None:
@@ -857,17 +874,39 @@ class ZoneService:
 
         rounded = round(new_temp, 1)
         if rounded != row.get("ZoneRoomTemp_F"):
-            repositories.update_zone_status(
-                row["ZoneName"], zone_room_temp_f=rounded
-            )
+            if room_temps is not None:
+                room_temps.append((row["ZoneName"], rounded))
+            else:
+                repositories.update_zone_status(
+                    row["ZoneName"], zone_room_temp_f=rounded
+                )
         row["ZoneRoomTemp_F"] = rounded
         return row
 
+    def _load_schedules(self, rows: Iterable[Dict[str, Any]]) -> _ScheduleSnapshot:
+        """
+        Fetch the schedules of the AUTO zones in rows plus the global schedule
+        with two queries, for passes that resolve setpoints for many zones.
+        """
+        auto_zones = [
+            row["ZoneName"] for row in rows if row.get("ControlMode") == "AUTO"
+        ]
+        return (
+            repositories.list_schedules_for_zones(auto_zones),
+            repositories.list_global_schedule(),
+        )
+
     def _resolve_scheduled_setpoint(
-        self, zone_name: str, moment: Optional[datetime] = None
+        self,
+        zone_name: str,
+        moment: Optional[datetime] = None,
+        schedules: Optional[_ScheduleSnapshot] = None,
     ) -> Optional[float]:
         # Avoid strict tz dependencies; operate in local time when tzdata is missing.
-        entries = repositories.list_zone_schedule(zone_name)
+        if schedules is not None and zone_name in schedules[0]:
+            entries = schedules[0][zone_name]
+        else:
+            entries = repositories.list_zone_schedule(zone_name)
         setpoint = self._evaluate_schedule(entries, moment, tzinfo=None)
         if setpoint is not None:
             return setpoint
@@ -875,18 +914,24 @@ class ZoneService:
         if upcoming is not None:
             return upcoming
 
-        global_entries = repositories.list_global_schedule()
+        if schedules is not None:
+            global_entries = schedules[1]
+        else:
+            global_entries = repositories.list_global_schedule()
         setpoint = self._evaluate_schedule(global_entries, moment, tzinfo=None)
         if setpoint is not None:
             return setpoint
         return self._next_schedule_setpoint(global_entries, moment, tzinfo=None)
-    def _sync_auto_setpoint(self, row: Dict[str, Any]) -> Dict[str, Any]:
+    def _sync_auto_setpoint(
+        self, row: Dict[str, Any], schedules: Optional[_ScheduleSnapshot] = None
+    ) -> Dict[str, Any]:
         """
         Ensure AUTO-controlled zones reflect the scheduled setpoint immediately.
         Respects manual overrides based on mode:
         - 'boundary': override until next schedule boundary (schedule change detected)
         - 'permanent': override indefinitely until manually cleared
         - 'timed': override until specified datetime
+        Pass schedules (from _load_schedules) to skip the per-zone schedule reads.
         """
         control_mode = row.get("ControlMode")
         zone_name = row.get("ZoneName")
@@ -898,7 +943,7 @@ class ZoneService:
         ):
             return row
 
-        scheduled_setpoint = self._resolve_scheduled_setpoint(zone_name)
+        scheduled_setpoint = self._resolve_scheduled_setpoint(zone_name, schedules=schedules)
         if scheduled_setpoint is None:
             return row
 
@@ -982,13 +1027,18 @@ class ZoneService:
         Apply scheduled setpoints to AUTO zones after schedule updates.
         """
         targets = zone_names or settings.zone_names
+        rows = {row["ZoneName"]: row for row in repositories.list_all_zone_rows()}
+        auto_rows = []
         for zone in targets:
             if zone in self._zones_without_setpoint:
                 continue
-            row = repositories.get_zone_status(zone)
+            row = rows.get(zone)
             if not row or row.get("ControlMode") != "AUTO":
                 continue
-            self._sync_auto_setpoint(row)
+            auto_rows.append(row)
+        schedules = self._load_schedules(auto_rows)
+        for row in auto_rows:
+            self._sync_auto_setpoint(row, schedules)
 
     @staticmethod
     def _time_to_minutes(value: Optional[str]) -> Optional[int]:
@@ -1006,18 +1056,41 @@ class ZoneService:
         except (ValueError, TypeError):
             return None
 
-    def tick_auto_control(self) -> None:
+    def tick_auto_control(self) -> int:
+        """
+        Re-evaluate every AUTO zone once. Returns how many zones switched
+        ON/OFF so the caller can re-check sooner while zones are cycling.
+        """
         system_status = repositories.get_system_status()
         outside_temp = system_status.get("OutsideTemp_F") if system_status else None
-        for raw_row in repositories.list_zone_status():
-            working_row = raw_row
-            zone_name = raw_row.get("ZoneName", "?")
-            control_mode = raw_row.get("ControlMode", "?")
-            logger.debug(f"tick_auto_control: {zone_name} has ControlMode={control_mode}")
-            if raw_row.get("ControlMode") == "AUTO":
-                working_row = self._ensure_auto_state(raw_row, outside_temp)
-            decorated = self._decorate_row(working_row)
-            self._maybe_record_sample(decorated, outside_temp)
+        changed = 0
+        readings: List[Tuple[Any, ...]] = []
+        room_temps: List[Tuple[str, float]] = []
+        zone_rows = repositories.list_zone_status()
+        schedules = self._load_schedules(zone_rows)
+        try:
+            for raw_row in zone_rows:
+                working_row = raw_row
+                zone_name = raw_row.get("ZoneName", "?")
+                control_mode = raw_row.get("ControlMode", "?")
+                logger.debug(f"tick_auto_control: {zone_name} has ControlMode={control_mode}")
+                if raw_row.get("ControlMode") == "AUTO":
+                    working_row = self._ensure_auto_state(
+                        raw_row, outside_temp, schedules, room_temps
+                    )
+                    if working_row.get("CurrentState") != raw_row.get("CurrentState"):
+                        changed += 1
+                decorated = self._decorate_row(working_row)
+                reading = self._maybe_collect_sample(decorated, outside_temp)
+                if reading is not None:
+                    readings.append(reading)
+        finally:
+            # One transaction each for the simulated temperatures and the samples
+            # of the whole pass, instead of commits per zone. Flushed even if a
+            # zone fails so the zones already processed keep their writes.
+            repositories.update_zone_room_temps(room_temps)
+            self.events.log_samples(readings)
+        return changed
 
     def _decorate_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         row = dict(row)
@@ -1035,16 +1108,14 @@ class ZoneService:
 
     def get_zone_statistics(
         self,
-        window: str = "day",
+        window: Literal["day", "week", "month"] = "day",
         day: Optional[str] = None,
     ) -> List[ZoneStatisticsModel]:
         start_time = time.perf_counter()
+        # The API layer restricts window to these keys via its Literal annotation.
         window_map = {"day": 1, "week": 7, "month": 30}
-        normalized_window = window.lower()
-        if normalized_window not in window_map:
-            raise ValueError("window must be one of: day, week, month")
 
-        tzinfo = ZoneInfo(settings.time_zone)
+        tzinfo = _get_tzinfo(settings.time_zone)
         if day:
             try:
                 day_dt = datetime.strptime(day, "%Y-%m-%d")
@@ -1054,7 +1125,7 @@ class ZoneService:
         else:
             anchor_end_local = datetime.now(tzinfo)
 
-        window_days = window_map[normalized_window]
+        window_days = window_map[window]
         window_start_local = anchor_end_local - timedelta(days=window_days)
         month_start_local = anchor_end_local - timedelta(days=30)
 
@@ -1115,7 +1186,7 @@ class ZoneService:
                     total_run_window_seconds=total_window_seconds,
                     total_run_30day_seconds=monthly_seconds,
                     average_room_temp_f=avg_room_temp,
-                    window=normalized_window,
+                    window=window,
                     window_hours=window_hours,
                     window_start=window_start_utc.isoformat(),
                     window_end=window_end_utc.isoformat(),
@@ -1342,7 +1413,7 @@ class ZoneService:
 
         if day:
             try:
-                tzinfo = ZoneInfo(tz)
+                tzinfo = _get_tzinfo(tz)
             except Exception as exc:  # pragma: no cover - invalid timezone supplied
                 raise ValueError(f"Unknown timezone '{tz}'") from exc
             try:
@@ -1689,23 +1760,27 @@ class ZoneService:
                 for cache_key in stale_keys:
                     self._history_batch_cache.pop(cache_key, None)
 
-    def _maybe_record_sample(
+    def _maybe_collect_sample(
         self,
         row: Dict[str, Any],
         outside_temp: Optional[float],
-    ) -> None:
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Return a (timestamp, zone, room, pipe, outside) reading when the zone's
+        sample interval has elapsed; the caller persists them in one batch.
+        """
         zone_name = row.get("ZoneName")
         if not zone_name:
-            return
+            return None
 
         now = datetime.utcnow()
         last = self._last_sample.get(zone_name)
         if last and now - last < self._sample_interval:
-            return
+            return None
 
         room_temp = row.get("ZoneRoomTemp_F")
         if room_temp is None:
-            return
+            return None
 
         resolved_outside = outside_temp
         if resolved_outside is None:
@@ -1714,19 +1789,4 @@ class ZoneService:
         pipe_temp = row.get("PipeTemp_F")
 
         self._last_sample[zone_name] = now
-        self.events.log_event(
-            source=zone_name,
-            event="SAMPLE",
-            zone_room_temp_f=room_temp,
-            pipe_temp_f=pipe_temp,
-            outside_temp_f=resolved_outside,
-            duration_seconds=None,
-            timestamp=now,
-        )
-        repositories.record_temperature_sample(
-            zone_name=zone_name,
-            timestamp=now,
-            room_temp_f=room_temp,
-            pipe_temp_f=pipe_temp,
-            outside_temp_f=resolved_outside,
-        )
+        return (now, zone_name, room_temp, pipe_temp, resolved_outside)
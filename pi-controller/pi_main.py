@@ -9,7 +9,7 @@ import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 # Add parent and shared to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -181,11 +181,11 @@ async def temperature_sampling_loop():
             await asyncio.sleep(30)  # Sample every 30 seconds
 
             updated_zones = []
+            # Read every sensor in one pass rather than two calls per zone
+            readings = hw_controller.read_all_temperatures()
             for zone_name in settings.zone_names:
                 try:
-                    # Read temperatures from hardware
-                    room_temp = hw_controller.read_zone_temperature(zone_name)
-                    pipe_temp = hw_controller.read_pipe_temperature(zone_name)
+                    room_temp, pipe_temp = readings.get(zone_name, (None, None))
 
                     # Update database
                     repositories.update_zone_status(
@@ -408,7 +408,7 @@ def zone_history_batch(
 
 @app.get("/api/zones/stats")
 def get_zone_stats(
-    window: str = Query("day", pattern="^(day|week|month)$"),
+    window: Literal["day", "week", "month"] = Query("day"),
     day: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$")
 ):
     """Get zone statistics for a time window."""
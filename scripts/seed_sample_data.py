@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from random import Random
 
 from backend.config import settings
-from backend.database import init_db
+from backend.database import finalize_indexes, init_db
 from backend import repositories
 
 
@@ -67,6 +67,7 @@ def seed_temperature_samples(randomizer: Random) -> None:
 
     while current_time <= now:
         outside_temp = 28.0 + randomizer.uniform(-5.0, 5.0)
+        samples = []
 
         for index, zone_name in enumerate(settings.zone_names, start=1):
             # Simulate zones turning on/off throughout the day
@@ -84,14 +85,11 @@ def seed_temperature_samples(randomizer: Random) -> None:
             else:
                 pipe_temp = 95.0 + randomizer.uniform(-3.0, 3.0)
 
-            repositories.record_temperature_sample(
-                zone_name=zone_name,
-                room_temp_f=round(room_temp, 1),
-                pipe_temp_f=round(pipe_temp, 1),
-                outside_temp_f=round(outside_temp, 1),
-                timestamp=current_time,
+            samples.append(
+                (zone_name, round(room_temp, 1), round(pipe_temp, 1), round(outside_temp, 1))
             )
 
+        repositories.record_temperature_samples(samples, timestamp=current_time)
         sample_count += 1
         current_time += timedelta(minutes=5)
 
@@ -167,11 +165,13 @@ def seed_event_log(randomizer: Random) -> None:
 def main() -> None:
     # Deterministic seed so repeated runs produce the same data (handy for UI testing).
     randomizer = Random(42)
-    init_db()
+    # Load into unindexed tables (fresh databases only) and index once at the end.
+    init_db(create_indexes=False)
 
     seed_zone_status(randomizer)
     seed_event_log(randomizer)
     seed_temperature_samples(randomizer)
+    finalize_indexes()
     print("Sample data inserted.")
 
 
@@ -11,7 +11,6 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 try:
     from backend import repositories
-    from backend.services.zone_service import _normalize_row_keys
 except ImportError as e:
     print(f"Import error: {e}")
     print("\nThis test must be run on the Raspberry Pi where the full environment is configured.")
@@ -35,7 +34,6 @@ def test_override_modes():
     )
 
     zone = repositories.get_zone_status(zone_name)
-    zone = _normalize_row_keys(zone)
     print(f"   Setpoint: {zone['TargetSetpoint_F']}°F")
     print(f"   Override Mode: {zone['SetpointOverrideMode']}")
     print(f"   Override At: {zone['SetpointOverrideAt']}")
@@ -51,7 +49,6 @@ def test_override_modes():
     )
 
     zone = repositories.get_zone_status(zone_name)
-    zone = _normalize_row_keys(zone)
     print(f"   Setpoint: {zone['TargetSetpoint_F']}°F")
     print(f"   Override Mode: {zone['SetpointOverrideMode']}")
     print(f"   ✓ Permanent mode set successfully")
@@ -68,7 +65,6 @@ def test_override_modes():
     )
 
     zone = repositories.get_zone_status(zone_name)
-    zone = _normalize_row_keys(zone)
     print(f"   Setpoint: {zone['TargetSetpoint_F']}°F")
     print(f"   Override Mode: {zone['SetpointOverrideMode']}")
     print(f"   Override Until: {zone['SetpointOverrideUntil']}")
@@ -82,7 +78,6 @@ def test_override_modes():
     )
 
     zone = repositories.get_zone_status(zone_name)
-    zone = _normalize_row_keys(zone)
     print(f"   Override Mode: {zone['SetpointOverrideMode']}")
     print(f"   Override At: {zone['SetpointOverrideAt']}")
     print(f"   Override Until: {zone['SetpointOverrideUntil']}")
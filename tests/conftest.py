@@ -1,8 +1,30 @@
 import os
 import sys
 
+import pytest
+
 # Ensure project root is on sys.path for `import backend`
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(PROJECT_ROOT)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """
+    Point the backend at a fresh SQLite file so tests never write to the
+    configured (or shipped) database.
+    """
+    from backend import database, repositories
+    from backend.config import settings
+
+    monkeypatch.setattr(settings, "database_url", "")
+    monkeypatch.setattr(settings, "database_type", "sqlite")
+    monkeypatch.setattr(settings, "database_path", tmp_path / "test.sqlite3")
+    # These helpers are bound to the configured database type at import.
+    monkeypatch.setattr(database, "get_connection", database._get_sqlite_connection_cm)
+    monkeypatch.setattr(database, "bootstrap_zone_rows", database._bootstrap_sqlite)
+    monkeypatch.setattr(repositories, "get_connection", database._get_sqlite_connection_cm)
+    database.init_db()
+    return settings.database_path
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from backend.database import init_db
-from backend import repositories
+from backend import database, repositories
 
 
 def test_event_log_insert_and_fetch(tmp_path, monkeypatch):
@@ -34,3 +34,42 @@ def test_event_log_insert_and_fetch(tmp_path, monkeypatch):
     rows = repositories.fetch_events(source="Z1", limit=10)
     assert len(rows) >= 2
     assert {r["Event"] for r in rows} >= {"ON", "OFF"}
+
+
+def test_record_temperature_samples_batch(temp_db):
+    stamp = datetime.utcnow()
+    repositories.record_temperature_samples(
+        [("Z1", 68.0, 120.0, 30.0), ("Z2", 66.5, None, 30.0)],
+        timestamp=stamp,
+    )
+
+    with database.get_connection() as conn:
+        cursor = conn.execute(
+            "SELECT ZoneName, RoomTemp_F, PipeTemp_F FROM TemperatureSamples "
+            "WHERE Timestamp = ? ORDER BY ZoneName",
+            (stamp.isoformat(),),
+        )
+        rows = cursor.fetchall()
+    assert [tuple(r) for r in rows] == [("Z1", 68.0, 120.0), ("Z2", 66.5, None)]
+
+
+def test_record_sample_readings_writes_events_and_samples(temp_db):
+    stamp = datetime.utcnow()
+    repositories.record_sample_readings([(stamp, "Z3", 67.0, 115.0, 28.0)])
+
+    with database.get_connection() as conn:
+        sample = conn.execute(
+            "SELECT RoomTemp_F FROM TemperatureSamples WHERE Timestamp = ? AND ZoneName = ?",
+            (stamp.isoformat(), "Z3"),
+        ).fetchone()
+        event = conn.execute(
+            "SELECT Event, ZoneRoomTemp_F FROM EventLog WHERE Timestamp = ? AND Source = ?",
+            (stamp.isoformat(), "Z3"),
+        ).fetchone()
+    assert tuple(sample) == (67.0,)
+    assert tuple(event) == ("SAMPLE", 67.0)
+
+
+def test_get_zone_names_in_returns_existing_only(temp_db):
+    assert repositories.get_zone_names_in(["Z1", "Z2", "Nope"]) == {"Z1", "Z2"}
+    assert repositories.get_zone_names_in([]) == set()
@@ -35,3 +35,57 @@ def test_sync_auto_setpoint_updates_target():
     row["ControlMode"] = "AUTO"
     updated = svc._sync_auto_setpoint(row)
     assert round(updated.get("TargetSetpoint_F") or 0, 1) == 70.0
+
+
+def test_list_events_cache_refreshes_after_log_event(temp_db):
+    svc = EventService()
+    before = svc.list_events(source="Z2", limit=5, cache=True)
+    assert svc.list_events(source="Z2", limit=5, cache=True) == before
+
+    svc.log_event(
+        source="Z2",
+        event="ON",
+        zone_room_temp_f=66.0,
+        pipe_temp_f=90.0,
+        outside_temp_f=30.0,
+        duration_seconds=None,
+        timestamp=datetime(2099, 1, 1, 0, 0, 0),
+    )
+    after = svc.list_events(source="Z2", limit=5, cache=True)
+    assert after[0].timestamp.startswith("2099-01-01")
+
+    # Writes that bypass the service are seen by uncached callers.
+    repositories.record_event(
+        source="Z2",
+        event="OFF",
+        zone_room_temp_f=67.0,
+        pipe_temp_f=80.0,
+        outside_temp_f=30.0,
+        duration_seconds=60.0,
+        timestamp=datetime(2099, 1, 2, 0, 0, 0),
+    )
+    assert svc.list_events(source="Z2", limit=5)[0].event == "OFF"
+
+
+def test_resume_schedule_restores_backup_after_restart(temp_db):
+    zone = settings.zone_names[0]
+    original = [
+        {
+            "DayOfWeek": 2,
+            "StartTime": "06:00",
+            "EndTime": "08:00",
+            "Setpoint_F": 69.0,
+            "Enabled": 1,
+        }
+    ]
+    repositories.replace_zone_schedule(zone, original)
+    hw = MockHardwareController(settings.zone_names)
+    ZoneService(hardware=hw, event_service=EventService()).apply_uniform_setpoint(62.0)
+
+    # A fresh service (as after a restart) still knows what to restore.
+    ZoneService(hardware=hw, event_service=EventService()).resume_schedule_mode()
+    restored = repositories.list_zone_schedule(zone)
+    assert [(r["DayOfWeek"], r["StartTime"], r["Setpoint_F"]) for r in restored] == [
+        (2, "06:00", 69.0)
+    ]
+    assert zone not in repositories.list_comfort_backups()